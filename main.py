@@ -14,6 +14,22 @@ from vmt_engine.simulation import Simulation
 from scenarios.loader import load_scenario
 from vmt_pygame.renderer import VMTRenderer
 
+# Frame cap used when VMT_TARGET_FPS is unset or invalid
+DEFAULT_TARGET_FPS = 60
+
+
+def get_target_fps() -> int:
+    """Return the frame cap from VMT_TARGET_FPS (at least 1, default if unparsable)."""
+    value = os.getenv('VMT_TARGET_FPS')
+    if value is None:
+        return DEFAULT_TARGET_FPS
+    try:
+        target_fps = int(value)
+    except ValueError:
+        print(f"Ignoring invalid VMT_TARGET_FPS={value!r}; using {DEFAULT_TARGET_FPS}")
+        return DEFAULT_TARGET_FPS
+    return max(1, target_fps)
+
 
 def main():
     """Run VMT simulation with visualization."""
@@ -40,6 +56,8 @@ def main():
     running = True
     paused = False
     tick_rate = 1  # Ticks per second
+    target_fps = get_target_fps()  # Frame cap, independent of tick rate
+    step_elapsed_ms = 0.0  # Time accumulated towards the next simulation step
     
     print("\nControls:")
     print("  SPACE: Pause/Resume")
@@ -68,6 +86,10 @@ def main():
                 # Handle window resize
                 renderer.handle_resize(event.w, event.h)
             
+            elif event.type == pygame.VIDEOEXPOSE:
+                # Window contents were lost; repaint even if nothing changed
+                renderer.request_redraw()
+            
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     paused = not paused
@@ -142,15 +164,22 @@ def main():
         keys = pygame.key.get_pressed()
         renderer.handle_camera_input(keys)
         
-        # Update simulation
+        # Update simulation at tick_rate, independent of the frame rate
         if not paused:
-            sim.step()
+            step_ms = 1000.0 / tick_rate
+            steps = min(int(step_elapsed_ms // step_ms), -(-tick_rate // target_fps))
+            for _ in range(steps):
+                sim.step()
+            # Drop any backlog a slow step left behind rather than catching up
+            step_elapsed_ms = min(step_elapsed_ms - steps * step_ms, step_ms)
         
-        # Render
+        # Render (skipped by the renderer when nothing visible changed)
         renderer.render()
         
         # Control frame rate
-        clock.tick(tick_rate)
+        frame_ms = clock.tick(target_fps)
+        if not paused:
+            step_elapsed_ms += frame_ms
     
     sim.close()
 
@@ -212,6 +212,10 @@ class TelemetryDatabase:
             CREATE INDEX IF NOT EXISTS idx_trade_attempts_run_tick 
             ON trade_attempts(run_id, tick)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_trade_attempts_pair 
+            ON trade_attempts(run_id, buyer_id, seller_id, tick)
+        """)
         
         # Mode transition tracking
         cursor.execute("""
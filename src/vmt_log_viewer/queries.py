@@ -4,6 +4,11 @@ SQL query builders for log viewer.
 
 from typing import Optional
 
+# Leading columns of get_trades_at_tick, which trades can also be ordered by
+TRADE_DISPLAY_COLUMNS = (
+    'buyer_id', 'seller_id', 'x', 'y', 'dA', 'dB', 'price', 'direction', 'exchange_pair_type',
+)
+
 
 class QueryBuilder:
     """Builds SQL queries for telemetry analysis."""
@@ -73,10 +78,59 @@ class QueryBuilder:
         return query, tuple(params)
     
     @staticmethod
-    def get_trades_at_tick(run_id: int, tick: int) -> tuple[str, tuple]:
-        """Get all trades at a specific tick."""
+    def get_trades_at_tick(run_id: int, tick: int,
+                          limit: Optional[int] = None,
+                          offset: int = 0,
+                          order_by: Optional[str] = None,
+                          descending: bool = False) -> tuple[str, tuple]:
+        """
+        Get trades at a specific tick, optionally one page at a time.
+        
+        The display columns come first, in trade table order, so rows can be
+        read positionally.
+        
+        Rows are in id order unless order_by names one of the display
+        columns, in which case they are sorted on it (NULLs last in either
+        direction, ties by id) so pages can be fetched in sorted order.
+        
+        The SQL text is the same for every call with the same ordering
+        (LIMIT -1 means no limit in SQLite), so sqlite3's per-connection
+        statement cache reuses a single prepared statement while scrubbing
+        and only the parameters change.
+        """
+        if order_by is None:
+            order = "id"
+        elif order_by in TRADE_DISPLAY_COLUMNS:
+            direction = "DESC" if descending else "ASC"
+            order = f"{order_by} IS NULL, {order_by} {direction}, id"
+        else:
+            raise ValueError(f"Cannot order trades by {order_by!r}")
+        
+        query = f"""
+            SELECT buyer_id, seller_id, x, y, dA, dB, price, direction,
+                   exchange_pair_type, id, run_id, tick,
+                   buyer_surplus, seller_surplus
+            FROM trades
+            WHERE run_id = ? AND tick = ?
+            ORDER BY {order}
+            LIMIT ? OFFSET ?
+        """
+        return query, (run_id, tick, -1 if limit is None else limit, offset)
+    
+    @staticmethod
+    def get_trade_summary_at_tick(run_id: int, tick: int) -> tuple[str, tuple]:
+        """
+        Get trade count and totals for a specific tick.
+        
+        Totals are integer sums (0 at a tick with no trades); avg_price is
+        NULL when there are no trades.
+        """
         query = """
-            SELECT *
+            SELECT
+                COUNT(*) as trade_count,
+                COALESCE(SUM(dA), 0) as total_dA,
+                COALESCE(SUM(dB), 0) as total_dB,
+                AVG(price) as avg_price
             FROM trades
             WHERE run_id = ? AND tick = ?
         """
@@ -6,7 +6,11 @@ from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QSlider, QLabel,
     QPushButton, QSpinBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+
+
+# Quiet period before a slider/spinbox change is propagated to the views
+TICK_DEBOUNCE_MS = 60
 
 
 class TimelineWidget(QWidget):
@@ -19,6 +23,13 @@ class TimelineWidget(QWidget):
         self.min_tick = 0
         self.max_tick = 0
         self.current_tick = 0
+        
+        # Coalesce rapid slider/spinbox changes into a single tick_changed
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(TICK_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self._flush)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -57,7 +68,6 @@ class TimelineWidget(QWidget):
         self.slider.setMinimum(0)
         self.slider.setMaximum(100)
         self.slider.setValue(0)
-        self.slider.valueChanged.connect(self.on_slider_changed)
         controls_layout.addWidget(self.slider, stretch=1)
         
         # Tick spinbox
@@ -65,9 +75,15 @@ class TimelineWidget(QWidget):
         self.tick_spinbox.setMinimum(0)
         self.tick_spinbox.setMaximum(100)
         self.tick_spinbox.setPrefix("Tick: ")
-        self.tick_spinbox.valueChanged.connect(self.on_spinbox_changed)
         controls_layout.addWidget(self.tick_spinbox)
         
+        # The slider and spinbox mirror each other (setValue is a no-op when
+        # the value is unchanged, so this does not loop); the slider alone
+        # drives current_tick
+        self.slider.valueChanged.connect(self.tick_spinbox.setValue)
+        self.tick_spinbox.valueChanged.connect(self.slider.setValue)
+        self.slider.valueChanged.connect(self.on_slider_changed)
+        
         layout.addLayout(controls_layout)
         
         # Range label
@@ -90,29 +106,19 @@ class TimelineWidget(QWidget):
     def set_tick(self, tick: int):
         """Set current tick (programmatically)."""
         if self.min_tick <= tick <= self.max_tick:
-            self.current_tick = tick
-            self.slider.blockSignals(True)
-            self.tick_spinbox.blockSignals(True)
             self.slider.setValue(tick)
-            self.tick_spinbox.setValue(tick)
-            self.slider.blockSignals(False)
-            self.tick_spinbox.blockSignals(False)
+            self.current_tick = tick
+            # Programmatic changes are not emitted
+            self._emit_timer.stop()
     
     def on_slider_changed(self, value: int):
-        """Handle slider value change."""
+        """Handle a tick change from the slider or the spinbox."""
         self.current_tick = value
-        self.tick_spinbox.blockSignals(True)
-        self.tick_spinbox.setValue(value)
-        self.tick_spinbox.blockSignals(False)
-        self.tick_changed.emit(value)
+        self._emit_timer.start()
     
-    def on_spinbox_changed(self, value: int):
-        """Handle spinbox value change."""
-        self.current_tick = value
-        self.slider.blockSignals(True)
-        self.slider.setValue(value)
-        self.slider.blockSignals(False)
-        self.tick_changed.emit(value)
+    def _flush(self):
+        """Emit the settled tick after a burst of slider/spinbox changes."""
+        self.tick_changed.emit(self.current_tick)
     
     def prev_tick(self):
         """Go to previous tick."""
@@ -2,14 +2,93 @@
 Trade view widget for analyzing trades.
 """
 
+import sqlite3
+from collections import OrderedDict
+from typing import Optional
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QLabel, QPushButton, QGroupBox
+    QTableWidgetItem, QLabel, QPushButton, QGroupBox, QTreeView, QHeaderView
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QStandardItem, QStandardItemModel
+
+from ..queries import QueryBuilder, TRADE_DISPLAY_COLUMNS
+
+
+# Number of ticks whose query results are kept for timeline scrubbing
+TRADE_CACHE_SIZE = 256
+
+# Trades fetched per page; more are loaded as the table is scrolled
+TRADE_PAGE_SIZE = 500
+
+# Columns shown in the trade attempts view
+ATTEMPT_HEADERS = ['Attempt', 'dA', 'dB', 'Result', 'Reason']
 
-from ..queries import QueryBuilder
+# Columns shown in the trades table, in display order; these are also the
+# leading columns of QueryBuilder.get_trades_at_tick, so rows are indexed
+# positionally
+TRADE_COLUMNS = TRADE_DISPLAY_COLUMNS
+
+
+def _format_float(value) -> str:
+    """Format a REAL column for the trades table."""
+    return "" if value is None else f"{value:.6f}"
+
+
+def _format_str(value) -> str:
+    """Format an INTEGER/TEXT column for the trades table."""
+    return "" if value is None else str(value)
+
+
+# Per-column cell formatters, fixed by the trades schema (price is the only REAL)
+TRADE_FORMATTERS = tuple(
+    _format_float if col == 'price' else _format_str for col in TRADE_COLUMNS
+)
+
+
+class TradeQuerySignals(QObject):
+    """Signals for TradeQueryRunnable (QRunnable is not a QObject)."""
+    
+    # (run_id, tick), cache generation, load epoch or None for prefetches,
+    # rows, summary row
+    finished = pyqtSignal(object, object, object, object, object)
+
+
+class TradeQueryRunnable(QRunnable):
+    """Fetch the first page of trades and the summary for a tick off the GUI thread."""
+    
+    def __init__(self, db_path, run_id: int, tick: int, generation: int, epoch: Optional[int]):
+        super().__init__()
+        self.db_path = db_path
+        self.run_id = run_id
+        self.tick = tick
+        self.generation = generation
+        self.epoch = epoch
+        self.signals = TradeQuerySignals()
+    
+    def run(self):
+        """Run both queries on a private read connection and emit the results."""
+        results = totals = None
+        try:
+            # The viewer's connection belongs to the GUI thread; WAL mode lets
+            # a second connection read concurrently
+            conn = sqlite3.connect(str(self.db_path))
+            conn.row_factory = sqlite3.Row
+            try:
+                query, params = QueryBuilder.get_trades_at_tick(
+                    self.run_id, self.tick, limit=TRADE_PAGE_SIZE
+                )
+                results = conn.execute(query, params).fetchall()
+                query, params = QueryBuilder.get_trade_summary_at_tick(self.run_id, self.tick)
+                totals = conn.execute(query, params).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            results = totals = None
+        self.signals.finished.emit(
+            (self.run_id, self.tick), self.generation, self.epoch, results, totals
+        )
 
 
 class TradeViewWidget(QWidget):
@@ -20,6 +99,42 @@ class TradeViewWidget(QWidget):
         self.db = None
         self.run_id = None
         self.current_tick = 0
+        
+        # Raw rows at the current tick in query order, the same rows in table
+        # order, and the total number of trades at the tick (rows are paged in)
+        self._current_rows: list = []
+        self._display_rows: list = []
+        self._current_total = 0
+        
+        # Column the table is sorted by (None for query order) and direction
+        self._sort_column: Optional[int] = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        
+        # HTML of the selected trade's details, before any attempts are appended
+        self._details_html = ""
+        
+        # Table rows allocated so far and how many of them are in use; the
+        # table only grows, surplus rows are hidden and their items reused
+        self._allocated_rows = 0
+        self._shown_rows = 0
+        
+        # LRU cache of (run_id, tick) -> (trade rows, summary row)
+        self._trade_cache: OrderedDict = OrderedDict()
+        # Incremented whenever the cache is cleared for another database;
+        # background results from an older generation are discarded
+        self._cache_generation = 0
+        
+        # Incremented per load_trades call; background results from an older
+        # load are cached but not displayed
+        self._load_epoch = 0
+        self._loading = False
+        
+        # Prefetch neighbouring ticks once scrubbing settles
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(50)
+        self._prefetch_timer.timeout.connect(self._prefetch_neighbours)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -33,7 +148,35 @@ class TradeViewWidget(QWidget):
         current_group.setLayout(current_layout)
         
         self.current_trades_table = QTableWidget()
+        self.current_trades_table.setColumnCount(len(TRADE_COLUMNS))
+        self.current_trades_table.setHorizontalHeaderLabels(list(TRADE_COLUMNS))
         self.current_trades_table.cellClicked.connect(self.on_trade_clicked)
+        self.current_trades_table.verticalScrollBar().valueChanged.connect(
+            self._on_trades_scrolled
+        )
+        
+        # Fixed column widths sized once from the header text and a typical
+        # price value, instead of resizeColumnsToContents() on every reload
+        metrics = self.current_trades_table.fontMetrics()
+        sample_width = metrics.horizontalAdvance("0000.000000")
+        header = self.current_trades_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for j, col in enumerate(TRADE_COLUMNS):
+            header.resizeSection(j, max(metrics.horizontalAdvance(col), sample_width) + 16)
+        
+        # Sorting is done on the native query values rather than by the
+        # table, which would compare the formatted cell text ("10" < "2")
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(-1, self._sort_order)
+        header.sortIndicatorChanged.connect(self._on_sort_changed)
+        
+        # Fixed row heights and no word wrap, so populating cells does not
+        # trigger per-item text measurement
+        self.current_trades_table.setWordWrap(False)
+        row_header = self.current_trades_table.verticalHeader()
+        row_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        row_header.setDefaultSectionSize(22)
         current_layout.addWidget(self.current_trades_table)
         
         self.current_trades_summary_label = QLabel("No trades at this tick")
@@ -54,77 +197,266 @@ class TradeViewWidget(QWidget):
         self.show_attempts_btn.setEnabled(False)
         details_layout.addWidget(self.show_attempts_btn)
         
+        # Trade attempts, one row per attempt so only visible rows are laid
+        # out. The section is collapsible and the view is created on first use.
+        self.attempts_group = QGroupBox("Trade Attempts")
+        self.attempts_group.setCheckable(True)
+        self.attempts_group.setVisible(False)
+        self.attempts_layout = QVBoxLayout()
+        self.attempts_group.setLayout(self.attempts_layout)
+        self.attempts_group.toggled.connect(self._on_attempts_toggled)
+        self.attempts_view = None
+        self.attempts_model = None
+        details_layout.addWidget(self.attempts_group)
+        
         layout.addWidget(details_group)
     
     def load_trades(self, db, run_id: int, tick: int):
         """Load trades for a specific tick."""
+        if db is not self.db:
+            self._trade_cache.clear()
+            self._cache_generation += 1
         self.db = db
         self.run_id = run_id
         self.current_tick = tick
+        self._load_epoch += 1
         
-        query, params = QueryBuilder.get_trades_at_tick(run_id, tick)
-        results = self.db.execute(query, params).fetchall()
-        
-        columns = ['buyer_id', 'seller_id', 'x', 'y', 'dA', 'dB', 'price', 'direction', 'exchange_pair_type']
-        
-        self.current_trades_table.setColumnCount(len(columns))
-        self.current_trades_table.setHorizontalHeaderLabels(columns)
-        self.current_trades_table.setRowCount(len(results))
+        key = (run_id, tick)
+        cached = self._trade_cache.get(key)
+        if cached is not None:
+            self._trade_cache.move_to_end(key)
+            self._show_trades(*cached)
+        elif self._db_path() is None:
+            self._show_trades(*self._fetch_trades(run_id, tick))
+        else:
+            # Query on a worker thread; _on_query_finished shows the result.
+            # Until then the table is emptied and disabled so the previous
+            # tick's rows are not shown under the new tick.
+            self._loading = True
+            self._current_rows = []
+            self._display_rows = []
+            self._current_total = 0
+            self._populate_rows([], 0)
+            self.current_trades_table.setEnabled(False)
+            self.current_trades_summary_label.setText("Loading trades...")
+            self._start_query(run_id, tick, self._load_epoch)
+    
+    def _db_path(self):
+        """Path of the open database file, or None if it cannot be reopened."""
+        return getattr(self.db, 'db_path', None)
+    
+    def _start_query(self, run_id: int, tick: int, epoch: Optional[int]):
+        """Run the trades query for a tick on the global thread pool."""
+        runnable = TradeQueryRunnable(
+            self._db_path(), run_id, tick, self._cache_generation, epoch
+        )
+        runnable.signals.finished.connect(self._on_query_finished)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_query_finished(self, key, generation, epoch, results, totals):
+        """Cache background query results and show them if still current."""
+        if generation != self._cache_generation:
+            # Queried from a database that has since been replaced
+            return
+        if results is None:
+            # Worker could not read the database; fall back to this thread
+            if epoch == self._load_epoch and self.db:
+                self._show_trades(*self._fetch_trades(*key))
+            return
+        if key[0] != self.run_id:
+            return
+        self._store_in_cache(key, (results, totals))
+        if epoch == self._load_epoch:
+            self._show_trades(results, totals)
+    
+    def _show_trades(self, results: list, totals):
+        """Fill the table and summary from a tick's rows and summary row."""
+        self._loading = False
+        self.current_trades_table.setEnabled(True)
+        self._current_rows = results
+        self._current_total = totals['trade_count'] if totals else 0
+        self._show_sorted()
         
-        for i, row in enumerate(results):
-            for j, col in enumerate(columns):
-                value = row[col]
-                if value is None:
-                    value = ""
-                if isinstance(value, float):
-                    value = f"{value:.6f}"
-                self.current_trades_table.setItem(i, j, QTableWidgetItem(str(value)))
-        
-        self.current_trades_table.resizeColumnsToContents()
-        
-        # Update summary
-        if len(results) > 0:
-            total_dA = sum(row['dA'] for row in results)
-            total_dB = sum(row['dB'] for row in results)
-            avg_price = sum(row['price'] for row in results) / len(results)
+        # Update summary (aggregated in SQL, so it covers all trades at the
+        # tick even when only the first page has been fetched)
+        if totals and totals['trade_count'] > 0:
             summary = (
-                f"{len(results)} trades | Total dA: {total_dA} | "
-                f"Total dB: {total_dB} | Avg Price: {avg_price:.4f}"
+                f"{totals['trade_count']} trades | Total dA: {totals['total_dA']} | "
+                f"Total dB: {totals['total_dB']} | Avg Price: {totals['avg_price']:.4f}"
             )
         else:
             summary = "No trades at this tick"
         
         self.current_trades_summary_label.setText(summary)
+        self._prefetch_timer.start()
+    
+    def _populate_rows(self, rows: list, start: int):
+        """Write rows into the trades table starting at table row `start`."""
+        # Format all cells up front, then populate with repaints, sorting
+        # and signals suspended so the table is rebuilt in one pass
+        formatters = tuple(enumerate(TRADE_FORMATTERS))
+        cells = [[fmt(row[j]) for j, fmt in formatters] for row in rows]
+        
+        table = self.current_trades_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            needed = start + len(cells)
+            if needed > self._allocated_rows:
+                # Grow geometrically; rows beyond what is needed start hidden
+                previous = self._allocated_rows
+                self._allocated_rows = max(needed, previous * 2)
+                table.setRowCount(self._allocated_rows)
+                for i in range(max(previous, needed), self._allocated_rows):
+                    table.setRowHidden(i, True)
+            
+            for i, values in enumerate(cells, start):
+                for j, value in enumerate(values):
+                    item = table.item(i, j)
+                    if item is None:
+                        table.setItem(i, j, QTableWidgetItem(value))
+                    else:
+                        item.setText(value)
+            
+            # Show the rows now in use and hide any left over from a larger tick
+            for i in range(self._shown_rows, needed):
+                table.setRowHidden(i, False)
+            for i in range(needed, self._shown_rows):
+                table.setRowHidden(i, True)
+            self._shown_rows = needed
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+    
+    def _on_trades_scrolled(self, value: int):
+        """Fetch the next page of trades when scrolled near the bottom."""
+        scrollbar = self.current_trades_table.verticalScrollBar()
+        if value >= scrollbar.maximum() - 5:
+            self.fetch_more_trades()
+    
+    def fetch_more_trades(self):
+        """Append the next page of trades at the current tick, if any remain."""
+        if not self.db or self.run_id is None:
+            return
+        loaded = len(self._display_rows)
+        if self._loading or loaded >= self._current_total:
+            return
+        
+        # Pages follow the table order, so they are only ever appended
+        page = self._fetch_page(loaded)
+        
+        # Unsorted, the displayed list is the cached one, so revisiting the
+        # tick keeps the pages
+        self._display_rows.extend(page)
+        self._populate_rows(page, loaded)
+    
+    def _fetch_page(self, offset: int) -> list:
+        """Fetch a page of trades at the current tick in table order."""
+        if self._sort_column is None:
+            order_by = None
+        else:
+            order_by = TRADE_COLUMNS[self._sort_column]
+        query, params = QueryBuilder.get_trades_at_tick(
+            self.run_id, self.current_tick, limit=TRADE_PAGE_SIZE, offset=offset,
+            order_by=order_by, descending=self._sort_order == Qt.SortOrder.DescendingOrder,
+        )
+        return self.db.execute(query, params).fetchall()
+    
+    def _show_sorted(self):
+        """Fill the table with the current tick's rows in table order."""
+        if self._sort_column is not None and len(self._current_rows) < self._current_total:
+            # Only some pages are loaded, so sort every trade at the tick in
+            # SQL and page through that order instead
+            self._display_rows = self._fetch_page(0)
+        else:
+            self._display_rows = self._sorted_rows()
+        self._populate_rows(self._display_rows, 0)
+    
+    def _sorted_rows(self) -> list:
+        """Return the current tick's loaded rows in table order (same order as SQL)."""
+        if self._sort_column is None:
+            return self._current_rows
+        j = self._sort_column
+        # NULLs (exchange_pair_type only has a default) go last in either
+        # direction, so only the non-NULL rows are reversed; ties keep query order
+        present = [row for row in self._current_rows if row[j] is not None]
+        missing = [row for row in self._current_rows if row[j] is None]
+        present.sort(
+            key=lambda row: row[j],
+            reverse=self._sort_order == Qt.SortOrder.DescendingOrder,
+        )
+        return present + missing
+    
+    def _on_sort_changed(self, column: int, order: Qt.SortOrder):
+        """Re-sort the trades table when a header section is clicked."""
+        self._sort_column = column if 0 <= column < len(TRADE_COLUMNS) else None
+        self._sort_order = order
+        self._show_sorted()
+    
+    def _fetch_trades(self, run_id: int, tick: int):
+        """Return (first page of trade rows, summary row) for a tick, using the LRU cache."""
+        key = (run_id, tick)
+        cached = self._trade_cache.get(key)
+        if cached is not None:
+            self._trade_cache.move_to_end(key)
+            return cached
+        
+        query, params = QueryBuilder.get_trades_at_tick(run_id, tick, limit=TRADE_PAGE_SIZE)
+        results = self.db.execute(query, params).fetchall()
+        
+        query, params = QueryBuilder.get_trade_summary_at_tick(run_id, tick)
+        totals = self.db.execute(query, params).fetchone()
+        
+        self._store_in_cache(key, (results, totals))
+        return results, totals
+    
+    def _store_in_cache(self, key: tuple[int, int], value: tuple):
+        """Insert a tick's results into the LRU cache, evicting the oldest."""
+        self._trade_cache[key] = value
+        self._trade_cache.move_to_end(key)
+        if len(self._trade_cache) > TRADE_CACHE_SIZE:
+            self._trade_cache.popitem(last=False)
+    
+    def _prefetch_neighbours(self):
+        """Warm the cache for the ticks either side of the current one."""
+        if not self.db or self.run_id is None:
+            return
+        for tick in (self.current_tick - 1, self.current_tick + 1):
+            if tick >= 0 and (self.run_id, tick) not in self._trade_cache:
+                if self._db_path() is None:
+                    self._fetch_trades(self.run_id, tick)
+                else:
+                    self._start_query(self.run_id, tick, None)
     
     def on_trade_clicked(self, row: int, col: int):
         """Handle click on trade table."""
-        if row < 0:
+        if row < 0 or row >= len(self._display_rows):
             return
         
-        buyer_id = int(self.current_trades_table.item(row, 0).text())
-        seller_id = int(self.current_trades_table.item(row, 1).text())
-        dA = int(self.current_trades_table.item(row, 4).text())
-        dB = int(self.current_trades_table.item(row, 5).text())
-        price = float(self.current_trades_table.item(row, 6).text())
-        direction = self.current_trades_table.item(row, 7).text()
-        exchange_pair_type = self.current_trades_table.item(row, 8).text()
+        # Read native values from the query row rather than re-parsing cell text
+        trade = self._display_rows[row]
         
         details = f"""
-<b>Buyer ID:</b> {buyer_id}<br>
-<b>Seller ID:</b> {seller_id}<br>
-<b>Amount A Traded:</b> {dA}<br>
-<b>Amount B Traded:</b> {dB}<br>
-<b>Price:</b> {price:.6f}<br>
-<b>Direction:</b> {direction}<br>
-<b>Exchange Pair:</b> {exchange_pair_type}<br>
+<b>Buyer ID:</b> {trade['buyer_id']}<br>
+<b>Seller ID:</b> {trade['seller_id']}<br>
+<b>Amount A Traded:</b> {trade['dA']}<br>
+<b>Amount B Traded:</b> {trade['dB']}<br>
+<b>Price:</b> {trade['price']:.6f}<br>
+<b>Direction:</b> {trade['direction']}<br>
+<b>Exchange Pair:</b> {trade['exchange_pair_type']}<br>
 <b>Tick:</b> {self.current_tick}
 """
+        self._details_html = details
         self.details_label.setText(details)
         self.show_attempts_btn.setEnabled(True)
+        self.attempts_group.setVisible(False)
         
         # Store selected trade for attempts view
-        self.selected_buyer_id = buyer_id
-        self.selected_seller_id = seller_id
+        self.selected_buyer_id = trade['buyer_id']
+        self.selected_seller_id = trade['seller_id']
     
     def show_trade_attempts(self):
         """Show all attempts for the selected trade."""
@@ -140,21 +472,46 @@ class TradeViewWidget(QWidget):
         )
         results = self.db.execute(query, params).fetchall()
         
+        # Append to the stored details HTML rather than reading the label's
+        # rich text back with text()
         if not results:
+            self.attempts_group.setVisible(False)
             self.details_label.setText(
-                self.details_label.text() + 
+                self._details_html +
                 "<br><br><i>No detailed trade attempts recorded (not in DEBUG mode)</i>"
             )
             return
         
-        # Display attempts in a dialog or update the details view
-        attempts_text = f"<br><br><b>Trade Attempts ({len(results)} iterations):</b><br>"
+        self.details_label.setText(self._details_html)
+        self._ensure_attempts_view()
+        self.attempts_model.removeRows(0, self.attempts_model.rowCount())
         for i, row in enumerate(results):
-            attempts_text += f"""
-<br><i>Attempt {i+1}:</i>
-dA={row['dA_attempted']}, dB={row['dB_calculated']}, 
-Result={row['result']}, Reason={row['result_reason']}<br>
-"""
+            values = (
+                i + 1, row['dA_attempted'], row['dB_calculated'],
+                row['result'], row['result_reason'],
+            )
+            items = [QStandardItem(str(value)) for value in values]
+            for item in items:
+                item.setEditable(False)
+            self.attempts_model.appendRow(items)
         
-        self.details_label.setText(self.details_label.text() + attempts_text)
-
+        self.attempts_group.setTitle(f"Trade Attempts ({len(results)} iterations)")
+        self.attempts_group.setChecked(True)
+        self.attempts_group.setVisible(True)
+    
+    def _ensure_attempts_view(self):
+        """Create the attempts view and its model on first use."""
+        if self.attempts_view is not None:
+            return
+        self.attempts_model = QStandardItemModel(0, len(ATTEMPT_HEADERS), self)
+        self.attempts_model.setHorizontalHeaderLabels(ATTEMPT_HEADERS)
+        self.attempts_view = QTreeView()
+        self.attempts_view.setModel(self.attempts_model)
+        self.attempts_view.setRootIsDecorated(False)
+        self.attempts_view.setUniformRowHeights(True)
+        self.attempts_layout.addWidget(self.attempts_view)
+    
+    def _on_attempts_toggled(self, checked: bool):
+        """Collapse or expand the attempts section."""
+        if self.attempts_view is not None:
+            self.attempts_view.setVisible(checked)
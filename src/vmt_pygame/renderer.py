@@ -6,16 +6,109 @@ sparkles, exchange regime display) are DEPRECATED after money system removal.
 They are retained but non-functional. Future UI redesign will remove this code.
 """
 
+import bisect
 import math
 import os
 import platform
+from collections import defaultdict, deque
+import numpy as np
 import pygame
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional
 from decimal import Decimal
 
+from vmt_engine.econ import UCES, ULinear, UQuadratic, UTranslog, UStoneGeary
+
 if TYPE_CHECKING:
     from vmt_engine.simulation import Simulation
     from vmt_engine.core import Agent
+    from vmt_engine.core.grid import Resource
+
+# Surface.fblits (pygame-ce) skips building the list of dirty rects that
+# Surface.blits returns; fall back to blits(doreturn=False) elsewhere
+HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+# Maximum number of rendered text surfaces kept between frames
+TEXT_CACHE_SIZE = 2048
+
+# Above this many dirty rects a frame is presented with a full flip instead
+MAX_DIRTY_RECTS = 512
+
+# Dirty rects are merged on a grid of square tiles of this many pixels, and a
+# frame whose tiles cover more than MAX_DIRTY_FRACTION of the screen is flipped
+DIRTY_TILE_SIZE = 32
+MAX_DIRTY_FRACTION = 0.75
+
+# Largest co-located group size whose display offsets are precomputed
+MAX_LAYOUT_GROUP = 32
+
+# Number of most recent trades kept for the exchange rate averages
+TRADE_HISTORY_LENGTH = 1000
+
+# HUD controls line, indexed by whether the camera can scroll
+HUD_CONTROLS_TEXT = (
+    "SPACE=Pause R=Reset S=Step ↑↓=Speed T/F/A/O=Arrows [=Panel ]=HUD I=Info Q=Quit",
+    "SPACE=Pause R=Reset S=Step ←→↑↓=Scroll/Speed T/F/A/O=Arrows [=Panel ]=HUD I=Info Q=Quit",
+)
+
+# HUD arrow status keyed by (show_trade_arrows, show_forage_arrows)
+HUD_ARROW_STATUS_TEXT = {
+    (False, False): "Arrows: OFF",
+    (True, False): "Arrows: Trade",
+    (False, True): "Arrows: Forage",
+    (True, True): "Arrows: Trade+Forage",
+}
+
+# Arrowhead side length and the rotation of its sides (30 degrees) off the shaft
+ARROW_HEAD_LENGTH = 8
+ARROW_HEAD_COS = math.cos(math.pi / 6)
+ARROW_HEAD_SIN = math.sin(math.pi / 6)
+
+
+class Palette(NamedTuple):
+    """Theme-dependent renderer colors."""
+    background: tuple[int, int, int]
+    panel_background: tuple[int, int, int]
+    panel_border: tuple[int, int, int]
+    grid_line: tuple[int, int, int]
+    text: tuple[int, int, int]
+    text_muted: tuple[int, int, int]
+    outline: tuple[int, int, int]
+    text_outline: tuple[int, int, int]
+
+
+LIGHT_PALETTE = Palette(
+    background=(255, 255, 255),
+    panel_background=(240, 240, 240),
+    panel_border=(0, 0, 0),
+    grid_line=(200, 200, 200),
+    text=(0, 0, 0),
+    text_muted=(80, 80, 80),
+    outline=(0, 0, 0),
+    text_outline=(0, 0, 0),
+)
+
+DARK_PALETTE = Palette(
+    background=(16, 16, 22),
+    panel_background=(30, 32, 38),
+    panel_border=(90, 90, 100),
+    grid_line=(60, 60, 72),
+    text=(235, 235, 240),
+    text_muted=(180, 180, 190),
+    outline=(210, 210, 215),
+    text_outline=(0, 0, 0),
+)
+
+# Indexed by use_dark_theme
+PALETTES = (LIGHT_PALETTE, DARK_PALETTE)
+
+# Short agent labels by utility class
+UTILITY_TYPE_LABELS = {
+    UCES: "CES",
+    ULinear: "LIN",
+    UQuadratic: "QUA",
+    UTranslog: "TRL",
+    UStoneGeary: "SG",
+}
 
 
 class VMTRenderer:
@@ -110,6 +203,70 @@ class VMTRenderer:
         self.COLOR_GOLD = (255, 215, 0)
         self.COLOR_DARK_GOLD = (218, 165, 32)
         
+        # Agent colors by utility class
+        self.UTILITY_TYPE_COLORS = {
+            UCES: self.COLOR_GREEN,
+            ULinear: self.COLOR_PURPLE,
+            UQuadratic: self.COLOR_BLUE,
+            UTranslog: (255, 140, 0),     # Dark orange
+            UStoneGeary: (255, 20, 147),  # Deep pink
+        }
+        
+        # Pre-rendered grid lines, rebuilt when the key below changes
+        self._grid_surface = None
+        self._grid_surface_key = None
+        
+        # Pre-rendered home marker, rebuilt when the key below changes
+        self._home_marker = None
+        self._home_marker_key = None
+        
+        # Pre-rendered agent circles keyed by (fill color, radius, outline color)
+        self._agent_sprites: dict[tuple, pygame.Surface] = {}
+        # Pre-rendered idle agent border rings keyed by (radius, width, color)
+        self._idle_border_sprites: dict[tuple, pygame.Surface] = {}
+        
+        # Per-agent (utility, color, id text, utility label), see _agent_render_tags
+        self._agent_tags: dict[int, tuple] = {}
+        
+        # Idle agents and target arrows for the tick in the key (see _target_arrow_plan)
+        self._arrow_plan: tuple[list[tuple], list[tuple], dict] = ([], [], {})
+        self._arrow_plan_key = None
+        
+        # Agents grouped by cell for the tick in the key (see group_agents_by_position)
+        self._position_groups: dict[tuple[int, int], list['Agent']] = {}
+        self._position_groups_key = None
+        # The same groups as parallel arrays: (x, y) per group and its agents
+        self._group_cells = np.empty((0, 2), dtype=np.int64)
+        self._group_members: list[list['Agent']] = []
+        # Groups in view for the tick and viewport in the key (see visible_agent_groups)
+        self._visible_groups: list[tuple[int, int, list['Agent']]] = []
+        self._visible_groups_key = None
+        # Cells carrying a resource type in the simulation in the key, in
+        # x-major order, with their positions as an array (see draw_resources)
+        self._resource_cells: list[tuple[tuple[int, int], 'Resource']] = []
+        self._resource_cell_xy = np.empty((0, 2), dtype=np.int64)
+        self._resource_cells_key = None
+        # Distinct home cells of the simulation in the key (see draw_home_positions)
+        self._home_cells = np.empty((0, 2), dtype=np.int64)
+        self._home_cells_key = None
+        
+        # State of the last presented frame, used to limit display updates
+        # to the regions that changed (see _collect_dirty_rects)
+        self._last_frame_key = None
+        self._last_grid_rects: list[pygame.Rect] = []
+        self._last_resource_state: dict[tuple[int, int], tuple] = {}
+        self._resource_state: dict[tuple[int, int], tuple] = {}
+        # Everything the last drawn frame depended on (see _render_version)
+        self._rendered_version = None
+        
+        # Co-location offsets for groups up to MAX_LAYOUT_GROUP, built for this
+        # cell size, and for larger groups as they are first seen
+        self._layout_offsets: list[list[tuple[int, int]]] = []
+        self._large_layout_offsets: dict[int, list[tuple[int, int]]] = {}
+        # Arrowhead corner offsets per grid displacement, for this cell size
+        self._arrow_heads: dict[tuple[int, int], Optional[tuple[float, float, float, float]]] = {}
+        self._layout_offsets_cell_size = None
+        
         # Calculate initial layout
         self._calculate_layout(DEFAULT_WIDTH, DEFAULT_HEIGHT, cell_size)
         
@@ -120,8 +277,19 @@ class VMTRenderer:
         self.show_trade_arrows = False
         self.show_forage_arrows = False
         
+        # Formatted HUD lines of the recent trades last shown, keyed by trade fields
+        self._trade_texts: dict[tuple, str] = {}
+        
         # Exchange rate tracking
-        self.trade_history = []  # List of (tick, exchange_pair_type, rate) tuples
+        # (tick, exchange_pair_type, rate) tuples, oldest dropped first
+        self.trade_history: deque[tuple] = deque(maxlen=TRADE_HISTORY_LENGTH)
+        # Rates in trade_history by (tick, rate type), for duplicate checks
+        self._trade_history_index: dict[tuple[int, str], list] = {}
+        # trade_history split by rate type into parallel (ticks, rates) lists,
+        # kept in step with it by update_trade_history. Ticks never decrease
+        # within one simulation, so time windows are found by bisection.
+        self._rate_history: dict[str, tuple[list[int], list]] = {}
+        self._trade_history_sim_id = id(self.sim)
     
     def _should_use_dark_theme(self) -> bool:
         """Determine whether to enable the renderer's dark theme."""
@@ -139,24 +307,15 @@ class VMTRenderer:
 
     def _init_colors(self) -> None:
         """Initialize renderer colors based on the active theme."""
-        if self.use_dark_theme:
-            self.COLOR_BACKGROUND = (16, 16, 22)
-            self.COLOR_PANEL_BACKGROUND = (30, 32, 38)
-            self.COLOR_PANEL_BORDER = (90, 90, 100)
-            self.COLOR_GRID_LINE = (60, 60, 72)
-            self.COLOR_TEXT = (235, 235, 240)
-            self.COLOR_TEXT_MUTED = (180, 180, 190)
-            self.COLOR_OUTLINE = (210, 210, 215)
-            self.COLOR_TEXT_OUTLINE = (0, 0, 0)
-        else:
-            self.COLOR_BACKGROUND = (255, 255, 255)
-            self.COLOR_PANEL_BACKGROUND = (240, 240, 240)
-            self.COLOR_PANEL_BORDER = (0, 0, 0)
-            self.COLOR_GRID_LINE = (200, 200, 200)
-            self.COLOR_TEXT = (0, 0, 0)
-            self.COLOR_TEXT_MUTED = (80, 80, 80)
-            self.COLOR_OUTLINE = (0, 0, 0)
-            self.COLOR_TEXT_OUTLINE = (0, 0, 0)
+        self.palette = PALETTES[self.use_dark_theme]
+        self.COLOR_BACKGROUND = self.palette.background
+        self.COLOR_PANEL_BACKGROUND = self.palette.panel_background
+        self.COLOR_PANEL_BORDER = self.palette.panel_border
+        self.COLOR_GRID_LINE = self.palette.grid_line
+        self.COLOR_TEXT = self.palette.text
+        self.COLOR_TEXT_MUTED = self.palette.text_muted
+        self.COLOR_OUTLINE = self.palette.outline
+        self.COLOR_TEXT_OUTLINE = self.palette.text_outline
 
         # Legacy names retained for downstream code until fully migrated.
         self.COLOR_WHITE = self.COLOR_BACKGROUND
@@ -188,8 +347,11 @@ class VMTRenderer:
         hud_ratio = 0.10
         self.hud_height = int(max(80, min(120, window_height * hud_ratio)))
         
+        # Screen x of the grid's left edge, used by every coordinate transform
+        self._left_offset = self.left_panel_width if self.show_left_panel else 0
+        
         # Calculate available space for grid (accounting for panels if shown)
-        available_width = window_width - (self.left_panel_width if self.show_left_panel else 0)
+        available_width = window_width - self._left_offset
         available_height = window_height - (self.hud_height if self.show_hud_panel else 0)
         
         # Calculate optimal cell size if not forced
@@ -205,6 +367,7 @@ class VMTRenderer:
         
         # Calculate actual grid dimensions
         grid_pixel_size = grid_size * self.cell_size
+        self._grid_pixel_size = grid_pixel_size
         
         # Determine if scrolling is needed
         self.needs_scrolling = (
@@ -221,7 +384,7 @@ class VMTRenderer:
             self.height = grid_pixel_size
         
         # Total window dimensions including panels
-        self.total_window_width = self.width + (self.left_panel_width if self.show_left_panel else 0)
+        self.total_window_width = self.width + self._left_offset
         self.window_height = self.height + (self.hud_height if self.show_hud_panel else 0)
         
         # Constrain camera position to valid bounds after resize
@@ -245,6 +408,40 @@ class VMTRenderer:
         small_font_size = max(7, min(12, self.cell_size // 4))
         self.font = pygame.font.SysFont('arial', base_font_size)
         self.small_font = pygame.font.SysFont('arial', small_font_size)
+        
+        # Resource tiles are cell-sized and cached text and panels use the
+        # old fonts and sizes, so drop them all
+        self._resource_tiles = {}
+        self._resource_labels = {}
+        self._agent_labels = {}
+        self._text_cache = {}
+        self._panel_cache = {}
+        
+        # Co-location offsets and arrowheads depend only on cell size (and
+        # group size or arrow displacement), so window resizes that keep the
+        # cell size reuse them
+        if self.cell_size != self._layout_offsets_cell_size:
+            self._build_layout_offsets()
+            self._arrow_heads = {}
+            self._layout_offsets_cell_size = self.cell_size
+    
+    def _render_text(self, text: str, font: pygame.font.Font, color: tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render antialiased text, reusing surfaces rendered in earlier frames.
+        
+        Labels such as agent IDs and utility types repeat every frame, so
+        almost every call is a cache hit. The cache is cleared whenever the
+        fonts are recreated.
+        """
+        key = (text, id(font), color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._text_cache[next(iter(self._text_cache))]
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
     
     def handle_resize(self, new_width: int, new_height: int):
         """
@@ -275,37 +472,60 @@ class VMTRenderer:
             return
         
         SCROLL_SPEED = self.cell_size  # Scroll by one cell at a time
-        grid_pixel_size = self.sim.grid.N * self.cell_size
         
         if keys[pygame.K_LEFT]:
             self.camera_x = max(0, self.camera_x - SCROLL_SPEED)
         if keys[pygame.K_RIGHT]:
-            max_x = max(0, grid_pixel_size - self.width)
+            max_x = max(0, self._grid_pixel_size - self.width)
             self.camera_x = min(max_x, self.camera_x + SCROLL_SPEED)
         if keys[pygame.K_UP]:
             self.camera_y = max(0, self.camera_y - SCROLL_SPEED)
         if keys[pygame.K_DOWN]:
-            max_y = max(0, grid_pixel_size - self.height)
+            max_y = max(0, self._grid_pixel_size - self.height)
             self.camera_y = min(max_y, self.camera_y + SCROLL_SPEED)
     
     def to_screen_coords(self, grid_x, grid_y):
         """Convert grid coordinates to screen coordinates with camera offset and left panel."""
-        left_offset = self.left_panel_width if self.show_left_panel else 0
         return (
-            left_offset + grid_x * self.cell_size - self.camera_x,
+            self._left_offset + grid_x * self.cell_size - self.camera_x,
             grid_y * self.cell_size - self.camera_y
         )
     
     def is_visible(self, screen_x, screen_y):
         """Check if coordinates are visible in current viewport (accounting for left panel)."""
-        left_offset = self.left_panel_width if self.show_left_panel else 0
         return (
-            left_offset - self.cell_size <= screen_x <= self.total_window_width + self.cell_size and
+            self._left_offset - self.cell_size <= screen_x <= self.total_window_width + self.cell_size and
             -self.cell_size <= screen_y <= self.height + self.cell_size
         )
     
-    def render(self):
-        """Render the current simulation state."""
+    def visible_cell_range(self) -> tuple[range, range]:
+        """
+        Return the grid x and y ranges of cells that pass is_visible.
+        
+        Lets callers loop over just the cells in view instead of testing
+        every cell in the grid.
+        """
+        cs = self.cell_size
+        N = self.sim.grid.N
+        # is_visible admits cells up to one cell beyond each viewport edge
+        x_start = max(0, (self.camera_x + cs - 1) // cs - 1)
+        x_end = min(N, (self.camera_x + self.width + cs) // cs + 1)
+        y_start = max(0, (self.camera_y + cs - 1) // cs - 1)
+        y_end = min(N, (self.camera_y + self.height + cs) // cs + 1)
+        return range(x_start, x_end), range(y_start, y_end)
+    
+    def render(self) -> bool:
+        """
+        Render the current simulation state.
+        
+        Returns False without drawing when nothing shown has changed since
+        the last frame (paused simulation, no camera or toggle changes).
+        """
+        version = self._render_version()
+        if version == self._rendered_version:
+            return False
+        self._rendered_version = version
+        
         self.screen.fill(self.COLOR_BACKGROUND)
         
         # Draw left info panel if enabled
@@ -325,88 +545,333 @@ class VMTRenderer:
         # Draw agents
         self.draw_agents()
         
+        # Arrows when toggled on; idle agent borders are drawn either way.
+        # Recent trades are listed in the HUD, so there are no grid indicators.
         self.draw_target_arrows()
-        self.draw_trade_indicators()
         
         # Draw HUD if enabled
         if self.show_hud_panel:
             self.draw_hud()
         
-        pygame.display.flip()
+        dirty_rects = self._collect_dirty_rects()
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+        return True
+    
+    def request_redraw(self):
+        """Force the next render() to draw and present the whole window, e.g. after an expose."""
+        self._rendered_version = None
+        # The window contents may be gone, so the next frame must be a full flip
+        self._last_frame_key = None
+    
+    def _render_version(self) -> tuple:
+        """Return a key that changes whenever the rendered frame would."""
+        return (
+            id(self.sim), self.sim.tick, self.screen.get_size(),
+            self.camera_x, self.camera_y, self.cell_size,
+            self.show_left_panel, self.show_hud_panel,
+            self.show_trade_arrows, self.show_forage_arrows,
+            id(self.recent_trades), len(self.recent_trades),
+        )
+    
+    def _collect_dirty_rects(self) -> Optional[list[pygame.Rect]]:
+        """
+        Return the screen regions that changed since the last frame.
+        
+        The whole frame is still drawn every time; this only limits what is
+        copied to the display. Returns None when a full flip is needed (first
+        frame, resize, camera move, panel or arrow toggle, simulation reset).
+        """
+        frame_key = (
+            id(self.sim), self.screen.get_size(), self.camera_x, self.camera_y,
+            self.cell_size, self.show_left_panel, self.show_hud_panel,
+            self.show_trade_arrows, self.show_forage_arrows,
+        )
+        grid_rects = self._agent_dirty_rects()
+        
+        dirty_rects = None
+        if frame_key == self._last_frame_key:
+            # Agents and arrows where they were last frame and where they are now
+            dirty_rects = self._last_grid_rects + grid_rects
+            
+            # Resource cells whose type or amount changed
+            previous = self._last_resource_state
+            current = self._resource_state
+            for pos in previous.keys() | current.keys():
+                if previous.get(pos) != current.get(pos):
+                    screen_x, screen_y = self.to_screen_coords(*pos)
+                    dirty_rects.append(pygame.Rect(
+                        screen_x - self.cell_size, screen_y - self.cell_size,
+                        3 * self.cell_size, 3 * self.cell_size
+                    ))
+            
+            # Panels change every tick and their text can run past the panel
+            # bounds, so present the whole strip left of and below the grid
+            screen_width, screen_height = frame_key[1]
+            if self.show_left_panel:
+                dirty_rects.append(pygame.Rect(0, 0, self.left_panel_width + 2, screen_height))
+            dirty_rects.append(pygame.Rect(0, self.height, screen_width, screen_height - self.height))
+            
+            dirty_rects = self._coalesce_dirty_rects(dirty_rects, frame_key[1])
+        
+        self._last_frame_key = frame_key
+        self._last_grid_rects = grid_rects
+        self._last_resource_state = self._resource_state
+        return dirty_rects
+    
+    @staticmethod
+    def _coalesce_dirty_rects(
+        rects: list[pygame.Rect], screen_size: tuple[int, int]
+    ) -> Optional[list[pygame.Rect]]:
+        """
+        Merge overlapping dirty rects into non-overlapping tile-aligned rects.
+        
+        Agent, arrow and panel rects overlap heavily, and display.update copies
+        every rect it is given. Marking the DIRTY_TILE_SIZE tiles each rect
+        touches and emitting runs of tiles copies each pixel at most once.
+        Returns None when a full flip is cheaper.
+        """
+        screen_width, screen_height = screen_size
+        max_area = MAX_DIRTY_FRACTION * screen_width * screen_height
+        
+        # The summed area bounds the merged area, so most busy frames are
+        # settled here without building the tile grid
+        if sum(rect.w * rect.h for rect in rects) > 4 * max_area:
+            return None
+        
+        tile = DIRTY_TILE_SIZE
+        rows = -(-screen_height // tile)
+        
+        # One bitmask of dirty tile columns per tile row
+        row_masks = [0] * rows
+        for rect in rects:
+            left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+            left = left if left > 0 else 0
+            top = top if top > 0 else 0
+            right = right if right < screen_width else screen_width
+            bottom = bottom if bottom < screen_height else screen_height
+            if left >= right or top >= bottom:
+                continue
+            first_column = left // tile
+            mask = ((1 << ((right - 1) // tile - first_column + 1)) - 1) << first_column
+            for row in range(top // tile, (bottom - 1) // tile + 1):
+                row_masks[row] |= mask
+        
+        dirty_tiles = sum(bin(mask).count('1') for mask in row_masks)
+        if dirty_tiles * tile * tile > max_area:
+            return None
+        
+        # Horizontal runs of dirty tiles, extended downwards while the row
+        # below has the same run
+        merged = []
+        open_runs: dict[tuple[int, int], pygame.Rect] = {}
+        for row, mask in enumerate(row_masks):
+            runs = {}
+            while mask:
+                start = (mask & -mask).bit_length() - 1
+                # End of the run is the lowest clear bit above start
+                gaps = ~mask >> start
+                end = start + (gaps & -gaps).bit_length() - 1
+                mask &= ~((1 << end) - 1)
+                span = (start, end)
+                rect = open_runs.get(span)
+                if rect is None:
+                    rect = pygame.Rect(start * tile, row * tile, (end - start) * tile, 0)
+                    merged.append(rect)
+                rect.height += tile
+                runs[span] = rect
+            open_runs = runs
+        
+        if len(merged) > MAX_DIRTY_RECTS:
+            return None
+        screen_rect = pygame.Rect(0, 0, screen_width, screen_height)
+        return [rect.clip(screen_rect) for rect in merged]
+    
+    def _agent_dirty_rects(self) -> list[pygame.Rect]:
+        """
+        Return screen rects covering everything drawn for agents this frame.
+        
+        Each agent's cell is padded by one cell on every side, which covers
+        labels, idle borders and high-activity outlines. Target arrows add
+        the box spanning both endpoint cells, padded for the arrowhead.
+        """
+        cs = self.cell_size
+        arrows_enabled = self.show_trade_arrows or self.show_forage_arrows
+        rects = []
+        
+        # Screen transform as locals (inlined to_screen_coords)
+        origin_x = self._left_offset - self.camera_x
+        origin_y = -self.camera_y
+        Rect = pygame.Rect
+        
+        for agent in self.sim.agents:
+            x, y = agent.pos
+            screen_x = origin_x + x * cs
+            screen_y = origin_y + y * cs
+            rects.append(Rect(screen_x - cs, screen_y - cs, 3 * cs, 3 * cs))
+            
+            if arrows_enabled and agent.target_pos is not None:
+                x, y = agent.target_pos
+                target_x = origin_x + x * cs
+                target_y = origin_y + y * cs
+                rects.append(Rect(
+                    min(screen_x, target_x) - 10, min(screen_y, target_y) - 10,
+                    abs(target_x - screen_x) + cs + 20, abs(target_y - screen_y) + cs + 20
+                ))
+        
+        return rects
     
     def draw_grid(self):
-        """Draw grid lines with camera offset and viewport culling."""
-        # Only draw visible grid lines
-        start_x = self.camera_x // self.cell_size
-        end_x = min(self.sim.grid.N, (self.camera_x + self.width) // self.cell_size + 1)
-        start_y = self.camera_y // self.cell_size
-        end_y = min(self.sim.grid.N, (self.camera_y + self.height) // self.cell_size + 1)
-        
-        left_offset = self.left_panel_width if self.show_left_panel else 0
-        
-        for x in range(start_x, end_x + 1):
-            screen_x = left_offset + x * self.cell_size - self.camera_x
-            pygame.draw.line(
-                self.screen, self.COLOR_GRID_LINE,
-                (screen_x, 0), (screen_x, self.height),
-                1
-            )
+        """Draw grid lines by blitting the visible part of a cached line surface."""
+        key = (self.cell_size, self.width, self.height, self.COLOR_GRID_LINE)
+        if key != self._grid_surface_key:
+            self._grid_surface = self._build_grid_surface()
+            self._grid_surface_key = key
+        
+        # Grid lines repeat every cell, so the cached surface only covers the
+        # viewport plus one cell and is blitted from the camera's phase within it
+        area = pygame.Rect(
+            self.camera_x % self.cell_size, self.camera_y % self.cell_size,
+            self.width + 1, self.height + 1
+        )
+        self.screen.blit(self._grid_surface, (self._left_offset, 0), area)
+    
+    def _build_grid_surface(self) -> pygame.Surface:
+        """
+        Render grid lines for one viewport plus one cell of scroll phase.
         
-        for y in range(start_y, end_y + 1):
-            screen_y = y * self.cell_size - self.camera_y
-            pygame.draw.line(
-                self.screen, self.COLOR_GRID_LINE,
-                (left_offset, screen_y), (left_offset + self.width, screen_y),
-                1
-            )
+        The camera never scrolls past the grid edge, so every line that falls
+        inside the viewport is a real grid line.
+        """
+        width = self.width + self.cell_size + 1
+        height = self.height + self.cell_size + 1
+        # Colorkeyed with RLE so blitting skips the transparent runs between lines
+        transparent = (255, 0, 255) if self.COLOR_GRID_LINE != (255, 0, 255) else (0, 255, 0)
+        surface = pygame.Surface((width, height)).convert()
+        surface.fill(transparent)
+        
+        # One-pixel lines are plain rect fills, which skip draw.line's clipping
+        # and line setup
+        fill = surface.fill
+        color = self.COLOR_GRID_LINE
+        for x in range(0, width, self.cell_size):
+            fill(color, (x, 0, 1, height))
+        for y in range(0, height, self.cell_size):
+            fill(color, (0, y, width, 1))
+        
+        surface.set_colorkey(transparent, pygame.RLEACCEL)
+        return surface
+    
+    def _blit_batch(self, blit_sequence: list):
+        """Blit (surface, dest) pairs onto the screen in order with one call."""
+        if not blit_sequence:
+            return
+        if HAS_FBLITS:
+            self.screen.fblits(blit_sequence)
+        else:
+            self.screen.blits(blit_sequence, doreturn=False)
     
     def draw_resources(self):
         """Draw resource cells with camera offset and viewport culling."""
-        for cell in self.sim.grid.cells.values():
-            if cell.resource.amount > 0 and cell.resource.type:
-                x, y = cell.position
-                screen_x, screen_y = self.to_screen_coords(x, y)
-                
-                # Skip if not visible
-                if not self.is_visible(screen_x, screen_y):
-                    continue
-                
+        # Tiles and labels are queued in drawing order and blitted together
+        blit_sequence = []
+        
+        # Visible resources as drawn, for dirty-rect tracking
+        self._resource_state = {}
+        
+        resource_state = self._resource_state
+        
+        # Tiles and labels per (type, amount), so unchanged cells skip the
+        # alpha and label formatting
+        tiles = {}
+        labels = self._resource_labels if self.show_resource_labels else None
+        
+        cs = self.cell_size
+        origin_x = self._left_offset - self.camera_x
+        origin_y = -self.camera_y
+        
+        # Resource types are assigned when the grid is seeded and only the
+        # amounts change afterwards, so the typed cells are collected once
+        # per simulation and the rest of the grid is never visited
+        grid_key = (id(self.sim), id(self.sim.grid))
+        if grid_key != self._resource_cells_key:
+            self._resource_cells = [
+                (pos, cell.resource) for pos, cell in sorted(self.sim.grid.cells.items())
+                if cell.resource.type
+            ]
+            self._resource_cell_xy = np.array(
+                [pos for pos, _ in self._resource_cells], dtype=np.int64
+            ).reshape(-1, 2)
+            self._resource_cells_key = grid_key
+        
+        # Only visit typed cells in view, in the same x-major order as grid.cells
+        x_range, y_range = self.visible_cell_range()
+        xs = self._resource_cell_xy[:, 0]
+        ys = self._resource_cell_xy[:, 1]
+        visible = np.flatnonzero(
+            (xs >= x_range.start) & (xs < x_range.stop) &
+            (ys >= y_range.start) & (ys < y_range.stop)
+        )
+        resource_cells = self._resource_cells
+        for i in visible.tolist():
+            (x, y), resource = resource_cells[i]
+            amount = resource.amount
+            if not amount > 0:
+                continue
+            
+            screen_x = origin_x + x * cs
+            screen_y = origin_y + y * cs
+            key = (resource.type, amount)
+            resource_state[(x, y)] = key
+            
+            tile = tiles.get(key)
+            if tile is None:
                 # Color based on resource type
-                if cell.resource.type == "A":
+                if resource.type == "A":
                     color = self.COLOR_RED
                 else:  # "B"
                     color = self.COLOR_BLUE
                 
                 # Alpha based on amount (lighter for less)
-                alpha = min(255, 100 + cell.resource.amount * 30)
-                surface = pygame.Surface((self.cell_size, self.cell_size))
-                surface.set_alpha(alpha)
-                surface.fill(color)
-                self.screen.blit(surface, (screen_x, screen_y))
-                
-                # Draw amount label if cell size permits
-                if self.show_resource_labels:
-                    label = self.small_font.render(
-                        f"{cell.resource.type}:{self.format_decimal(cell.resource.amount)}",
-                        True, self.COLOR_TEXT
+                alpha = int(min(255, 100 + amount * 30))
+                tile = tiles[key] = self._resource_tile(color, alpha)
+            blit_sequence.append((tile, (screen_x, screen_y)))
+            
+            # Draw amount label if cell size permits
+            if labels is not None:
+                label = labels.get(key)
+                if label is None:
+                    if len(labels) >= TEXT_CACHE_SIZE:
+                        labels.clear()
+                    label = labels[key] = self._render_text(
+                        f"{resource.type}:{self.format_decimal(amount)}",
+                        self.small_font, self.COLOR_TEXT
                     )
-                    self.screen.blit(label, (screen_x + 2, screen_y + 2))
+                blit_sequence.append((label, (screen_x + 2, screen_y + 2)))
+        
+        self._blit_batch(blit_sequence)
+    
+    def _resource_tile(self, color: tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """Return a cached cell-sized tile of the given color and surface alpha."""
+        key = (color, alpha)
+        tile = self._resource_tiles.get(key)
+        if tile is None:
+            tile = pygame.Surface((self.cell_size, self.cell_size)).convert()
+            tile.fill(color)
+            # Saturated tiles are left without surface alpha so they blit as a
+            # plain copy; pygame still takes the slower blending path at 255
+            if alpha < 255:
+                tile.set_alpha(alpha)
+            self._resource_tiles[key] = tile
+        return tile
     
     def draw_high_activity_cells(self):
         """Draw yellow outline for cells with 5 or more agents to highlight high-activity zones."""
-        # Group agents by position
-        position_groups = self.group_agents_by_position()
-        
-        # Draw yellow outline for cells with 5+ agents
-        for pos, agents in position_groups.items():
+        # Draw yellow outline for visible cells with 5+ agents
+        for screen_x, screen_y, agents in self.visible_agent_groups():
             if len(agents) >= 5:
-                x, y = pos
-                screen_x, screen_y = self.to_screen_coords(x, y)
-                
-                # Skip if not visible
-                if not self.is_visible(screen_x, screen_y):
-                    continue
-                
                 # Draw thick yellow outline
                 pygame.draw.rect(
                     self.screen, 
@@ -417,54 +882,112 @@ class VMTRenderer:
     
     def draw_home_positions(self):
         """Draw home position indicators for all agents."""
-        for agent in self.sim.agents:
-            if agent.home_pos is None:
-                continue
-                
-            x, y = agent.home_pos
-            screen_x, screen_y = self.to_screen_coords(x, y)
-            
-            # Skip if not visible
-            if not self.is_visible(screen_x, screen_y):
-                continue
-            
-            # Draw a small square in the corner of the home cell
-            home_size = max(3, self.cell_size // 8)
-            home_x = screen_x + self.cell_size - home_size - 2
-            home_y = screen_y + 2
-            
-            # Draw home indicator as a small square
-            pygame.draw.rect(
-                self.screen, self.COLOR_OUTLINE, 
-                (home_x, home_y, home_size, home_size)
-            )
-            pygame.draw.rect(
-                self.screen, self.COLOR_TEXT, 
-                (home_x + 1, home_y + 1, home_size - 2, home_size - 2)
-            )
+        # Draw a small square in the corner of the home cell
+        home_size = max(3, self.cell_size // 8)
+        marker = self._home_marker_tile(home_size)
+        
+        # Home positions are fixed when agents are created, so the distinct
+        # home cells are collected once per simulation. Markers are opaque
+        # and identical, so agents sharing a home need only one blit.
+        key = (id(self.sim), len(self.sim.agents))
+        if key != self._home_cells_key:
+            homes = {agent.home_pos for agent in self.sim.agents if agent.home_pos is not None}
+            self._home_cells = np.array(sorted(homes), dtype=np.int64).reshape(-1, 2)
+            self._home_cells_key = key
+        
+        # Screen positions and the is_visible test for all homes at once
+        cs = self.cell_size
+        cells = self._home_cells
+        screen_xs = cells[:, 0] * cs + (self._left_offset - self.camera_x)
+        screen_ys = cells[:, 1] * cs - self.camera_y
+        visible = (
+            (screen_xs >= self._left_offset - cs) & (screen_xs <= self.total_window_width + cs) &
+            (screen_ys >= -cs) & (screen_ys <= self.height + cs)
+        )
+        
+        home_xs = (screen_xs[visible] + (cs - home_size - 2)).tolist()
+        home_ys = (screen_ys[visible] + 2).tolist()
+        blit_sequence = [(marker, pos) for pos in zip(home_xs, home_ys)]
+        
+        self._blit_batch(blit_sequence)
+    
+    def _home_marker_tile(self, home_size: int) -> pygame.Surface:
+        """Return the home indicator square (outlined) for the given size."""
+        key = (home_size, self.COLOR_OUTLINE, self.COLOR_TEXT)
+        if key != self._home_marker_key:
+            marker = pygame.Surface((home_size, home_size)).convert()
+            marker.fill(self.COLOR_OUTLINE)
+            marker.fill(self.COLOR_TEXT, (1, 1, home_size - 2, home_size - 2))
+            self._home_marker = marker
+            self._home_marker_key = key
+        return self._home_marker
     
     def group_agents_by_position(self) -> dict[tuple[int, int], list['Agent']]:
         """
         Group agents by their grid position for smart co-location rendering.
         
+        Agents only move when the simulation steps, so the grouping is
+        computed once per tick and shared by every caller until then.
+        
         Returns:
             Dictionary mapping (x, y) position to list of agents at that position,
             sorted by agent ID for deterministic rendering.
         """
-        position_groups = {}
+        key = (id(self.sim), self.sim.tick)
+        if key == self._position_groups_key:
+            return self._position_groups
         
+        groups = defaultdict(list)
         for agent in self.sim.agents:
-            pos = agent.pos
-            if pos not in position_groups:
-                position_groups[pos] = []
-            position_groups[pos].append(agent)
+            groups[agent.pos].append(agent)
+        # Plain dict so lookups of empty cells don't insert entries
+        position_groups = dict(groups)
         
         # Sort agents within each group by ID for deterministic rendering
-        for pos in position_groups:
-            position_groups[pos].sort(key=lambda a: a.id)
-        
+        # (most cells hold a single agent and need no sort)
+        for agents in position_groups.values():
+            if len(agents) > 1:
+                agents.sort(key=lambda a: a.id)
+        
+        self._position_groups = position_groups
+        self._position_groups_key = key
+        self._group_cells = np.array(list(position_groups), dtype=np.int64).reshape(-1, 2)
+        self._group_members = list(position_groups.values())
         return position_groups
     
+    def visible_agent_groups(self) -> list[tuple[int, int, list['Agent']]]:
+        """
+        Return (screen_x, screen_y, agents) for each co-located group in view.
+        
+        Screen coordinates and the is_visible test are computed for all
+        groups at once with NumPy rather than per group in Python, once per
+        tick and viewport. Groups keep the order of group_agents_by_position.
+        """
+        self.group_agents_by_position()
+        key = (
+            self._position_groups_key, self.camera_x, self.camera_y,
+            self.cell_size, self._left_offset, self.total_window_width, self.height,
+        )
+        if key == self._visible_groups_key:
+            return self._visible_groups
+        
+        cells = self._group_cells
+        cs = self.cell_size
+        screen_xs = cells[:, 0] * cs + (self._left_offset - self.camera_x)
+        screen_ys = cells[:, 1] * cs - self.camera_y
+        visible = np.flatnonzero(
+            (screen_xs >= self._left_offset - cs) & (screen_xs <= self.total_window_width + cs) &
+            (screen_ys >= -cs) & (screen_ys <= self.height + cs)
+        )
+        members = self._group_members
+        self._visible_groups = list(zip(
+            screen_xs[visible].tolist(),
+            screen_ys[visible].tolist(),
+            [members[i] for i in visible.tolist()],
+        ))
+        self._visible_groups_key = key
+        return self._visible_groups
+    
     def calculate_agent_radius(self, cell_size: int, agent_count: int) -> int:
         """
         Calculate optimal agent radius based on co-location count.
@@ -501,12 +1024,9 @@ class VMTRenderer:
         """
         Calculate display position for agent within a co-located group.
         
-        Uses geometric layouts to minimize overlap:
-        - 1 agent: center (current behavior)
-        - 2 agents: diagonal opposite corners
-        - 3 agents: triangle pattern (one top, two bottom)
-        - 4 agents: one per corner
-        - 5+ agents: circle pack around center
+        Uses geometric layouts to minimize overlap (see _group_layout_offsets).
+        Offsets are cached per group size for the current cell size (see
+        _layout_offsets_for), so this is a table lookup.
         
         Args:
             agent_index: Index of agent in sorted group (0 to total_agents-1)
@@ -517,49 +1037,80 @@ class VMTRenderer:
         Returns:
             (px, py) display coordinates for this agent
         """
+        dx, dy = self._layout_offsets_for(total_agents)[agent_index]
+        return (cell_center_x + dx, cell_center_y + dy)
+    
+    def _layout_offsets_for(self, total_agents: int) -> list[tuple[int, int]]:
+        """Return the cached display offsets for a group of total_agents."""
+        if total_agents <= MAX_LAYOUT_GROUP:
+            return self._layout_offsets[total_agents]
+        offsets = self._large_layout_offsets.get(total_agents)
+        if offsets is None:
+            offsets = self._group_layout_offsets(total_agents)
+            self._large_layout_offsets[total_agents] = offsets
+        return offsets
+    
+    def _build_layout_offsets(self):
+        """Precompute display offsets for groups of up to MAX_LAYOUT_GROUP agents."""
+        self._layout_offsets = [
+            self._group_layout_offsets(n) for n in range(MAX_LAYOUT_GROUP + 1)
+        ]
+        self._large_layout_offsets = {}
+    
+    def _group_layout_offsets(self, total_agents: int) -> list[tuple[int, int]]:
+        """
+        Return (dx, dy) offsets from the cell center for each agent in a group.
+        
+        Uses geometric layouts to minimize overlap:
+        - 1 agent: center (current behavior)
+        - 2 agents: diagonal opposite corners
+        - 3 agents: triangle pattern (one top, two bottom)
+        - 4 agents: one per corner
+        - 5+ agents: circle pack around center
+        """
+        if total_agents == 0:
+            return []
+        
         if total_agents == 1:
             # Single agent - use center (current behavior)
-            return (cell_center_x, cell_center_y)
+            return [(0, 0)]
         
         elif total_agents == 2:
             # Two agents - opposite corners (diagonal)
             # Agent 0: upper-left, Agent 1: lower-right
             offset = self.cell_size // 4
-            if agent_index == 0:
-                return (cell_center_x - offset, cell_center_y - offset)
-            else:
-                return (cell_center_x + offset, cell_center_y + offset)
+            return [(-offset, -offset), (offset, offset)]
         
         elif total_agents == 3:
             # Three agents - triangle pattern
             # Angles: 90° (top), 210° (bottom-left), 330° (bottom-right)
             offset = self.cell_size // 4
-            angles = [90, 210, 330]
-            angle_rad = math.radians(angles[agent_index])
-            px = cell_center_x + int(offset * math.cos(angle_rad))
-            py = cell_center_y - int(offset * math.sin(angle_rad))  # Negative because y increases downward
-            return (px, py)
+            offsets = []
+            for angle in [90, 210, 330]:
+                angle_rad = math.radians(angle)
+                # Negative y because y increases downward
+                offsets.append((int(offset * math.cos(angle_rad)), -int(offset * math.sin(angle_rad))))
+            return offsets
         
         elif total_agents == 4:
             # Four agents - one per corner
             offset = self.cell_size // 4
-            corners = [
+            return [
                 (-offset, -offset),  # Upper-left
                 (offset, -offset),   # Upper-right
                 (-offset, offset),   # Lower-left
                 (offset, offset),    # Lower-right
             ]
-            dx, dy = corners[agent_index]
-            return (cell_center_x + dx, cell_center_y + dy)
         
         else:
             # 5+ agents - circle pack around center
             offset = self.cell_size // 3
             angle_step = 360 / total_agents
-            angle_rad = math.radians(agent_index * angle_step)
-            px = cell_center_x + int(offset * math.cos(angle_rad))
-            py = cell_center_y - int(offset * math.sin(angle_rad))
-            return (px, py)
+            offsets = []
+            for agent_index in range(total_agents):
+                angle_rad = math.radians(agent_index * angle_step)
+                offsets.append((int(offset * math.cos(angle_rad)), -int(offset * math.sin(angle_rad))))
+            return offsets
     
     def get_agent_color(self, agent: 'Agent') -> tuple[int, int, int]:
         """
@@ -572,19 +1123,7 @@ class VMTRenderer:
             RGB color tuple
         """
         if agent.utility:
-            utility_type = agent.utility.__class__.__name__
-            if utility_type == "UCES":
-                return self.COLOR_GREEN
-            elif utility_type == "ULinear":
-                return self.COLOR_PURPLE
-            elif utility_type == "UQuadratic":
-                return self.COLOR_BLUE
-            elif utility_type == "UTranslog":
-                return (255, 140, 0)  # Dark orange
-            elif utility_type == "UStoneGeary":
-                return (255, 20, 147)  # Deep pink
-            else:
-                return self.COLOR_YELLOW
+            return self.UTILITY_TYPE_COLORS.get(type(agent.utility), self.COLOR_YELLOW)
         return self.COLOR_TEXT
     
     def get_utility_type_label(self, agent: 'Agent') -> str:
@@ -598,21 +1137,25 @@ class VMTRenderer:
             Short string label (e.g., "CES", "LIN", "QUA", "TRL", "SG")
         """
         if agent.utility:
-            utility_type = agent.utility.__class__.__name__
-            if utility_type == "UCES":
-                return "CES"
-            elif utility_type == "ULinear":
-                return "LIN"
-            elif utility_type == "UQuadratic":
-                return "QUA"
-            elif utility_type == "UTranslog":
-                return "TRL"
-            elif utility_type == "UStoneGeary":
-                return "SG"
-            else:
-                return "???"
+            return UTILITY_TYPE_LABELS.get(type(agent.utility), "???")
         return "???"
     
+    def _agent_render_tags(self, agent: 'Agent') -> tuple[tuple[int, int, int], str, str]:
+        """
+        Return (color, id text, utility label) for an agent.
+        
+        Cached per agent ID and recomputed only if the agent's utility object
+        changes (e.g. a simulation reset reusing the same IDs).
+        """
+        tags = self._agent_tags.get(agent.id)
+        if tags is None or tags[0] is not agent.utility:
+            tags = (
+                agent.utility, self.get_agent_color(agent),
+                str(agent.id), self.get_utility_type_label(agent),
+            )
+            self._agent_tags[agent.id] = tags
+        return tags[1:]
+    
     def draw_group_inventory_labels(
         self,
         agents: list['Agent'],
@@ -645,7 +1188,7 @@ class VMTRenderer:
             agent = agents[0]
             inv_text = f"A:{self.format_decimal(agent.inventory.A)} B:{self.format_decimal(agent.inventory.B)}"
             
-            inv_label = self.small_font.render(inv_text, True, self.COLOR_TEXT)
+            inv_label = self._render_text(inv_text, self.small_font, self.COLOR_TEXT)
             inv_width = inv_label.get_width()
             self.screen.blit(inv_label, (cell_center_x - inv_width // 2, cell_bottom_y + 2))
         
@@ -654,7 +1197,7 @@ class VMTRenderer:
             for idx, agent in enumerate(agents):
                 inv_text = f"[{agent.id}] A:{self.format_decimal(agent.inventory.A)} B:{self.format_decimal(agent.inventory.B)}"
                 
-                inv_label = self.small_font.render(inv_text, True, self.COLOR_TEXT)
+                inv_label = self._render_text(inv_text, self.small_font, self.COLOR_TEXT)
                 inv_width = inv_label.get_width()
                 y_offset = cell_bottom_y + 2 + (idx * 12)  # 12px spacing between labels
                 
@@ -665,7 +1208,7 @@ class VMTRenderer:
         else:
             # 4+ agents - show summary only
             summary_text = f"{agent_count} agents at ({agents[0].pos[0]}, {agents[0].pos[1]})"
-            summary_label = self.small_font.render(summary_text, True, self.COLOR_TEXT)
+            summary_label = self._render_text(summary_text, self.small_font, self.COLOR_TEXT)
             summary_width = summary_label.get_width()
             self.screen.blit(summary_label, (cell_center_x - summary_width // 2, cell_bottom_y + 2))
     
@@ -680,17 +1223,11 @@ class VMTRenderer:
         
         This is a pure visualization enhancement - simulation positions remain unchanged.
         """
-        # Group agents by position
-        position_groups = self.group_agents_by_position()
+        # Sprites and labels are queued in drawing order and blitted at once
+        blit_sequence = []
         
-        for pos, agents in position_groups.items():
-            x, y = pos
-            screen_x, screen_y = self.to_screen_coords(x, y)
-            
-            # Skip if not visible
-            if not self.is_visible(screen_x, screen_y):
-                continue
-            
+        # Visible cells with their co-located agents
+        for screen_x, screen_y, agents in self.visible_agent_groups():
             # Calculate cell center
             cell_center_x = screen_x + self.cell_size // 2
             cell_center_y = screen_y + self.cell_size // 2
@@ -698,46 +1235,29 @@ class VMTRenderer:
             # Calculate optimal radius for this group size
             agent_count = len(agents)
             radius = self.calculate_agent_radius(self.cell_size, agent_count)
+            sprite_offset = radius + 1
             
             # Draw each agent in the group
-            for idx, agent in enumerate(agents):
-                # Get display position for this agent
-                px, py = self.calculate_agent_display_position(
-                    idx, agent_count, cell_center_x, cell_center_y
-                )
+            offsets = self._layout_offsets_for(agent_count)
+            for agent, (dx, dy) in zip(agents, offsets):
+                # Display position for this agent (see calculate_agent_display_position)
+                px = cell_center_x + dx
+                py = cell_center_y + dy
                 
-                # Get agent color
-                color = self.get_agent_color(agent)
+                # Get agent color and label text
+                color, id_text, util_type = self._agent_render_tags(agent)
                 
                 # Draw agent circle
-                pygame.draw.circle(self.screen, color, (px, py), radius)
-                pygame.draw.circle(
-                    self.screen, self.COLOR_OUTLINE, (px, py), radius,
-                    max(1, radius // 5)
-                )
+                sprite = self._agent_sprite(color, radius)
+                blit_sequence.append((sprite, (px - sprite_offset, py - sprite_offset)))
                 
                 # Draw agent ID and utility type label (if space permits and labels enabled)
                 if self.show_agent_labels and radius >= 5:
-                    # Draw agent ID on first line
-                    id_label = self.small_font.render(str(agent.id), True, self.COLOR_TEXT)
-                    id_height = id_label.get_height()
-                    
-                    # Get utility type label
-                    util_type = self.get_utility_type_label(agent)
-                    util_label = self.small_font.render(util_type, True, self.COLOR_TEXT)
-                    util_height = util_label.get_height()
-                    
-                    # Calculate total height and starting y position to center both lines
-                    total_height = id_height + util_height
-                    start_y = py - total_height // 2
-                    
-                    # Draw ID label
-                    id_rect = id_label.get_rect(center=(px, start_y + id_height // 2))
-                    self.screen.blit(id_label, id_rect)
-                    
-                    # Draw utility type label below ID
-                    util_rect = util_label.get_rect(center=(px, start_y + id_height + util_height // 2))
-                    self.screen.blit(util_label, util_rect)
+                    id_label, id_dx, id_dy, util_label, util_dx, util_dy = (
+                        self._agent_label_pair(id_text, util_type)
+                    )
+                    blit_sequence.append((id_label, (px + id_dx, py + id_dy)))
+                    blit_sequence.append((util_label, (px + util_dx, py + util_dy)))
             
             # Draw inventory labels below the entire group
             # Disabled to reduce visual clutter - inventory inspection feature coming soon
@@ -745,6 +1265,56 @@ class VMTRenderer:
             #     self.draw_group_inventory_labels(
             #         agents, screen_x, screen_y, agent_count
             #     )
+        
+        self._blit_batch(blit_sequence)
+    
+    def _agent_label_pair(self, id_text: str, util_type: str) -> tuple:
+        """
+        Return the agent ID and utility labels with their top-left offsets.
+        
+        The two lines are stacked and centered on the agent, so the offsets
+        from the agent's display position are fixed per label pair. Cleared
+        with the text cache when the fonts change.
+        """
+        key = (id_text, util_type)
+        pair = self._agent_labels.get(key)
+        if pair is None:
+            # Agent ID on the first line, utility type below it
+            id_label = self._render_text(id_text, self.small_font, self.COLOR_TEXT)
+            util_label = self._render_text(util_type, self.small_font, self.COLOR_TEXT)
+            id_height = id_label.get_height()
+            util_height = util_label.get_height()
+            
+            # Center both lines horizontally and the pair vertically, as
+            # get_rect(center=...) would place them
+            top = -((id_height + util_height) // 2)
+            pair = (
+                id_label, -(id_label.get_width() // 2), top,
+                util_label, -(util_label.get_width() // 2), top + id_height,
+            )
+            self._agent_labels[key] = pair
+        return pair
+    
+    def _agent_sprite(self, color: tuple[int, int, int], radius: int) -> pygame.Surface:
+        """Return a cached outlined agent circle centered at (radius + 1, radius + 1)."""
+        key = (color, radius, self.COLOR_OUTLINE)
+        sprite = self._agent_sprites.get(key)
+        if sprite is None:
+            size = 2 * radius + 2
+            center = (radius + 1, radius + 1)
+            # Colorkeyed with RLE like the grid surface; circles are drawn
+            # without antialiasing, so every pixel is either opaque or the key
+            transparent = next(
+                c for c in ((255, 0, 255), (0, 255, 255), (255, 255, 0))
+                if c != color and c != self.COLOR_OUTLINE
+            )
+            sprite = pygame.Surface((size, size)).convert()
+            sprite.fill(transparent)
+            pygame.draw.circle(sprite, color, center, radius)
+            pygame.draw.circle(sprite, self.COLOR_OUTLINE, center, radius, max(1, radius // 5))
+            sprite.set_colorkey(transparent, pygame.RLEACCEL)
+            self._agent_sprites[key] = sprite
+        return sprite
     
     def draw_arrow(self, start_pos, end_pos, color, width=2):
         """
@@ -760,40 +1330,133 @@ class VMTRenderer:
         pygame.draw.line(self.screen, color, start_pos, end_pos, width)
         
         # Calculate arrowhead
-        dx = end_pos[0] - start_pos[0]
-        dy = end_pos[1] - start_pos[1]
-        length = math.sqrt(dx*dx + dy*dy)
-        
-        if length < 1:
+        head = self._arrow_head(end_pos[0] - start_pos[0], end_pos[1] - start_pos[1])
+        if head is None:
             return  # Too short to draw arrowhead
-        
-        # Normalize direction
-        dx /= length
-        dy /= length
-        
-        # Arrowhead parameters
-        arrow_len = 8
-        arrow_angle = math.pi / 6  # 30 degrees
-        
-        # Calculate arrowhead points
-        p1 = (
-            end_pos[0] - arrow_len * (dx * math.cos(arrow_angle) + dy * math.sin(arrow_angle)),
-            end_pos[1] - arrow_len * (dy * math.cos(arrow_angle) - dx * math.sin(arrow_angle))
-        )
-        p2 = (
-            end_pos[0] - arrow_len * (dx * math.cos(arrow_angle) - dy * math.sin(arrow_angle)),
-            end_pos[1] - arrow_len * (dy * math.cos(arrow_angle) + dx * math.sin(arrow_angle))
-        )
+        p1 = (end_pos[0] - head[0], end_pos[1] - head[1])
+        p2 = (end_pos[0] - head[2], end_pos[1] - head[3])
         
         # Draw arrowhead
         pygame.draw.polygon(self.screen, color, [end_pos, p1, p2])
     
     def draw_target_arrows(self):
         """Draw arrows showing agent movement targets and highlight idle agents."""
-        # Track idle agents for border rendering (shown regardless of arrow settings)
-        idle_agents = []
+        idle_cells, arrows, arrows_by_cell = self._target_arrow_plan()
+        
+        if self.show_trade_arrows or self.show_forage_arrows:
+            # When fewer cells are in view than there are arrows (zoomed in on
+            # a large grid), look up the arrows touching visible cells instead
+            # of testing every arrow; drawing order is kept by arrow index
+            x_range, y_range = self.visible_cell_range()
+            if len(x_range) * len(y_range) < len(arrows):
+                candidates = set()
+                for x in x_range:
+                    for y in y_range:
+                        candidates.update(arrows_by_cell.get((x, y), ()))
+                arrows = [arrows[i] for i in sorted(candidates)]
+            
+            # Screen transform and viewport bounds hoisted out of the loop
+            # (inlined to_screen_coords and is_visible, offset to cell centers)
+            cs = self.cell_size
+            half = cs // 2
+            origin_x = self._left_offset - self.camera_x + half
+            origin_y = -self.camera_y + half
+            min_x = self._left_offset - cs + half
+            max_x = self.total_window_width + cs + half
+            min_y = -cs + half
+            max_y = self.height + cs + half
+            show_trade = self.show_trade_arrows
+            show_forage = self.show_forage_arrows
+            
+            # draw_arrow inlined, with the pygame draw calls bound once
+            screen = self.screen
+            draw_line = pygame.draw.line
+            draw_polygon = pygame.draw.polygon
+            heads = self._arrow_heads
+            
+            for is_trade, (agent_x, agent_y), (target_x, target_y), color in arrows:
+                # Skip if this arrow type is disabled
+                if not (show_trade if is_trade else show_forage):
+                    continue
+                
+                # Cell centers of both endpoints in screen coordinates
+                agent_center = (origin_x + agent_x * cs, origin_y + agent_y * cs)
+                target_center = (origin_x + target_x * cs, origin_y + target_y * cs)
+                
+                # Check if either endpoint is visible (viewport culling)
+                if not ((min_x <= agent_center[0] <= max_x and min_y <= agent_center[1] <= max_y) or
+                        (min_x <= target_center[0] <= max_x and min_y <= target_center[1] <= max_y)):
+                    continue
+                
+                # Draw arrow: shaft, then a head unless the arrow is too short
+                draw_line(screen, color, agent_center, target_center, 2)
+                displacement = (target_x - agent_x, target_y - agent_y)
+                head = heads.get(displacement)
+                if head is None:
+                    if displacement in heads:
+                        continue
+                    head = heads[displacement] = self._arrow_head(
+                        displacement[0] * cs, displacement[1] * cs
+                    )
+                    if head is None:
+                        continue
+                end_x, end_y = target_center
+                draw_polygon(screen, color, [
+                    target_center,
+                    (end_x - head[0], end_y - head[1]),
+                    (end_x - head[2], end_y - head[3]),
+                ])
+        
+        # Draw red borders for idle agents (shown regardless of arrow settings)
+        self._draw_idle_cells(idle_cells)
+    
+    @staticmethod
+    def _arrow_head(dx: int, dy: int) -> Optional[tuple[float, float, float, float]]:
+        """
+        Return how far each arrowhead corner lies back from the arrow's tip.
         
-        arrows_enabled = self.show_trade_arrows or self.show_forage_arrows
+        The head depends only on the shaft's screen displacement (dx, dy), so
+        draw_target_arrows caches it per grid displacement. Corners are
+        (end_x - h[0], end_y - h[1]) and (end_x - h[2], end_y - h[3]), the
+        same points draw_arrow computes. None if the arrow is too short for
+        a head.
+        """
+        length = math.hypot(dx, dy)
+        if length < 1:
+            return None
+        
+        # Unit direction scaled by the arrowhead length, rotated by +/-30
+        # degrees for the two sides
+        scale = ARROW_HEAD_LENGTH / length
+        dx *= scale
+        dy *= scale
+        cos_dx = dx * ARROW_HEAD_COS
+        cos_dy = dy * ARROW_HEAD_COS
+        sin_dx = dx * ARROW_HEAD_SIN
+        sin_dy = dy * ARROW_HEAD_SIN
+        return (cos_dx + sin_dy, cos_dy - sin_dx, cos_dx - sin_dy, cos_dy + sin_dx)
+    
+    def _target_arrow_plan(self) -> tuple[list[tuple], list[tuple], dict[tuple[int, int], list[int]]]:
+        """
+        Classify agents into idle agents and target arrows for the current tick.
+        
+        Targets only change when the simulation steps, so frames redrawn
+        within a tick (camera scrolling, toggles) reuse the classification.
+        
+        Returns:
+            (idle cells, arrows, arrows by cell) where idle cells are the
+            (cell, idle agent count) pairs from _idle_cells, each arrow is
+            (is_trade, agent grid pos, target grid pos, color), in agent order,
+            and arrows by cell maps each endpoint cell to the indices of the
+            arrows starting or ending there.
+        """
+        key = (id(self.sim), self.sim.tick)
+        if key == self._arrow_plan_key:
+            return self._arrow_plan
+        
+        idle_agents = []
+        arrows = []
+        arrows_by_cell = defaultdict(list)
         
         for agent in self.sim.agents:
             # Check if agent is idle (no target OR at home and targeting home)
@@ -808,48 +1471,11 @@ class VMTRenderer:
                 idle_agents.append(agent)
                 continue
             
-            # Skip arrow rendering if all arrows disabled
-            if not arrows_enabled:
-                continue
-            
             # Determine arrow type
             is_trade = agent.target_agent_id is not None
-            is_forage = agent.target_agent_id is None
-            is_idle_home = (is_forage and agent.home_pos is not None and 
+            is_idle_home = (not is_trade and agent.home_pos is not None and 
                           agent.target_pos == agent.home_pos)
             
-            # Skip if this arrow type is disabled
-            if is_trade and not self.show_trade_arrows:
-                continue
-            if is_forage and not self.show_forage_arrows:
-                continue
-            
-            # Skip if no target position (should not happen given earlier check)
-            if agent.target_pos is None:
-                continue
-            
-            # Convert positions to screen coordinates
-            agent_x, agent_y = agent.pos
-            target_x, target_y = agent.target_pos
-            
-            agent_screen = self.to_screen_coords(agent_x, agent_y)
-            target_screen = self.to_screen_coords(target_x, target_y)
-            
-            # Check if either endpoint is visible (viewport culling)
-            if not (self.is_visible(agent_screen[0], agent_screen[1]) or 
-                    self.is_visible(target_screen[0], target_screen[1])):
-                continue
-            
-            # Calculate cell centers for arrow endpoints
-            agent_center = (
-                agent_screen[0] + self.cell_size // 2,
-                agent_screen[1] + self.cell_size // 2
-            )
-            target_center = (
-                target_screen[0] + self.cell_size // 2,
-                target_screen[1] + self.cell_size // 2
-            )
-            
             # Choose color based on target type
             if is_trade:
                 color = self.COLOR_ARROW_TRADE
@@ -858,11 +1484,14 @@ class VMTRenderer:
             else:
                 color = self.COLOR_ARROW_FORAGE
             
-            # Draw arrow
-            self.draw_arrow(agent_center, target_center, color, width=2)
-        
-        # Draw red borders for idle agents
-        self.draw_idle_agent_borders(idle_agents)
+            arrows_by_cell[agent.pos].append(len(arrows))
+            if agent.target_pos != agent.pos:
+                arrows_by_cell[agent.target_pos].append(len(arrows))
+            arrows.append((is_trade, agent.pos, agent.target_pos, color))
+        
+        self._arrow_plan = (self._idle_cells(idle_agents), arrows, arrows_by_cell)
+        self._arrow_plan_key = key
+        return self._arrow_plan
     
     def draw_idle_agent_borders(self, idle_agents):
         """
@@ -871,48 +1500,79 @@ class VMTRenderer:
         Args:
             idle_agents: List of agents with no target_pos
         """
-        # Group idle agents by position for proper rendering
-        position_groups = {}
-        for agent in idle_agents:
-            pos = agent.pos
-            if pos not in position_groups:
-                position_groups[pos] = []
-            position_groups[pos].append(agent)
-        
-        # Sort agents within each group by ID for deterministic rendering
-        for pos in position_groups:
-            position_groups[pos].sort(key=lambda a: a.id)
+        self._draw_idle_cells(self._idle_cells(idle_agents))
+    
+    @staticmethod
+    def _idle_cells(idle_agents) -> list[tuple[tuple[int, int], int]]:
+        """
+        Return (cell, idle agent count) for each cell holding idle agents.
         
-        for pos, agents in position_groups.items():
-            x, y = pos
-            screen_x, screen_y = self.to_screen_coords(x, y)
+        Cells are ordered by their lowest idle agent ID, the order their
+        border groups are drawn in.
+        """
+        # Sorting by ID up front is linear for the usual ID-ordered input
+        counts = defaultdict(int)
+        for agent in sorted(idle_agents, key=lambda a: a.id):
+            counts[agent.pos] += 1
+        return list(counts.items())
+    
+    def _draw_idle_cells(self, idle_cells: list[tuple[tuple[int, int], int]]):
+        """Draw the idle agent borders for cells from _idle_cells."""
+        # Border rings are queued and blitted at once
+        blit_sequence = []
+        
+        # Screen transform and viewport bounds as locals (inlined
+        # to_screen_coords and is_visible)
+        cs = self.cell_size
+        origin_x = self._left_offset - self.camera_x
+        origin_y = -self.camera_y
+        min_x = self._left_offset - cs
+        max_x = self.total_window_width + cs
+        max_y = self.height + cs
+        
+        for (x, y), agent_count in idle_cells:
+            screen_x = origin_x + x * cs
+            screen_y = origin_y + y * cs
             
             # Skip if not visible
-            if not self.is_visible(screen_x, screen_y):
+            if not (min_x <= screen_x <= max_x and -cs <= screen_y <= max_y):
                 continue
             
             # Calculate cell center
-            cell_center_x = screen_x + self.cell_size // 2
-            cell_center_y = screen_y + self.cell_size // 2
+            cell_center_x = screen_x + cs // 2
+            cell_center_y = screen_y + cs // 2
             
             # Calculate optimal radius for this group size
-            agent_count = len(agents)
-            radius = self.calculate_agent_radius(self.cell_size, agent_count)
+            radius = self.calculate_agent_radius(cs, agent_count)
             
             # Draw red border for each idle agent
             border_width = max(2, radius // 3)  # Border scales with agent size
+            ring = self._idle_border_sprite(radius + border_width, border_width)
+            ring_offset = radius + border_width + 1
             
-            for idx, agent in enumerate(agents):
-                # Get display position for this agent (same logic as draw_agents)
-                px, py = self.calculate_agent_display_position(
-                    idx, agent_count, cell_center_x, cell_center_y
-                )
-                
+            # Display positions use the same offsets as draw_agents
+            for dx, dy in self._layout_offsets_for(agent_count):
                 # Draw red border circle
-                pygame.draw.circle(
-                    self.screen, self.COLOR_IDLE_BORDER, (px, py), 
-                    radius + border_width, border_width
+                blit_sequence.append(
+                    (ring, (cell_center_x + dx - ring_offset, cell_center_y + dy - ring_offset))
                 )
+        
+        self._blit_batch(blit_sequence)
+    
+    def _idle_border_sprite(self, radius: int, width: int) -> pygame.Surface:
+        """Return a cached idle border ring centered at (radius + 1, radius + 1)."""
+        key = (radius, width, self.COLOR_IDLE_BORDER)
+        sprite = self._idle_border_sprites.get(key)
+        if sprite is None:
+            size = 2 * radius + 2
+            # Colorkeyed like the agent sprites; the ring is not antialiased
+            transparent = (255, 0, 255) if self.COLOR_IDLE_BORDER != (255, 0, 255) else (0, 255, 255)
+            sprite = pygame.Surface((size, size)).convert()
+            sprite.fill(transparent)
+            pygame.draw.circle(sprite, self.COLOR_IDLE_BORDER, (radius + 1, radius + 1), radius, width)
+            sprite.set_colorkey(transparent, pygame.RLEACCEL)
+            self._idle_border_sprites[key] = sprite
+        return sprite
     
     def draw_agents_with_lambda_heatmap(self):
         """
@@ -929,6 +1589,19 @@ class VMTRenderer:
     
     def draw_hud(self):
         """Draw heads-up display with simulation info."""
+        # HUD contents only change between ticks, so reuse the last rendering.
+        # The cached area runs to the window edges since HUD text can
+        # overflow the HUD background.
+        key = (
+            id(self.sim), self.sim.tick, id(self.recent_trades),
+            self.show_trade_arrows, self.show_forage_arrows,
+        )
+        screen_width, screen_height = self.screen.get_size()
+        rect = pygame.Rect(0, self.height, screen_width, screen_height - self.height)
+        self._draw_cached_panel('hud', key, rect, self._render_hud)
+    
+    def _render_hud(self):
+        """Render the HUD directly onto the screen."""
         hud_y = self.height + 10
         
         # Background for HUD (spans entire window width including left panel)
@@ -937,62 +1610,58 @@ class VMTRenderer:
             (0, self.height, self.total_window_width, self.hud_height)
         )
         
+        # Labels are queued in drawing order and blitted at once
+        blit_sequence = []
+        
         # Tick counter
         tick_text = f"Tick: {self.sim.tick}"
-        tick_label = self.font.render(tick_text, True, self.COLOR_TEXT)
-        self.screen.blit(tick_label, (10, hud_y))
+        tick_label = self._render_text(tick_text, self.font, self.COLOR_TEXT)
+        blit_sequence.append((tick_label, (10, hud_y)))
         
         # Agent count
         agent_text = f"Agents: {len(self.sim.agents)}"
-        agent_label = self.font.render(agent_text, True, self.COLOR_TEXT)
-        self.screen.blit(agent_label, (10, hud_y + 20))
+        agent_label = self._render_text(agent_text, self.font, self.COLOR_TEXT)
+        blit_sequence.append((agent_label, (10, hud_y + 20)))
         
         # Mode info
         mode = self.sim.current_mode  # "forage", "trade", or "both"
         
         mode_text = f"Mode: {mode} | Economy: Barter-Only"
-        mode_label = self.font.render(mode_text, True, self.COLOR_TEXT)
-        self.screen.blit(mode_label, (10, hud_y + 40))
+        mode_label = self._render_text(mode_text, self.font, self.COLOR_TEXT)
+        blit_sequence.append((mode_label, (10, hud_y + 40)))
         
-        # Total inventory across all agents
-        total_A = sum(a.inventory.A for a in self.sim.agents)
-        total_B = sum(a.inventory.B for a in self.sim.agents)
+        # Total inventory across all agents, in one pass
+        total_A = total_B = 0
+        for agent in self.sim.agents:
+            inventory = agent.inventory
+            total_A += inventory.A
+            total_B += inventory.B
         
         # Money system removed - show only goods inventory
         inv_text = f"Total Inventory - A: {self.format_decimal(total_A)}  B: {self.format_decimal(total_B)}"
         
-        inv_label = self.font.render(inv_text, True, self.COLOR_TEXT)
-        self.screen.blit(inv_label, (10, hud_y + 60))
+        inv_label = self._render_text(inv_text, self.font, self.COLOR_TEXT)
+        blit_sequence.append((inv_label, (10, hud_y + 60)))
         
         # Controls (with scrolling if needed)
-        if self.needs_scrolling:
-            controls_text = "SPACE=Pause R=Reset S=Step ←→↑↓=Scroll/Speed T/F/A/O=Arrows [=Panel ]=HUD I=Info Q=Quit"
-        else:
-            controls_text = "SPACE=Pause R=Reset S=Step ↑↓=Speed T/F/A/O=Arrows [=Panel ]=HUD I=Info Q=Quit"
-        controls_label = self.small_font.render(controls_text, True, self.COLOR_TEXT)
-        self.screen.blit(controls_label, (10, hud_y + 80))
+        controls_text = HUD_CONTROLS_TEXT[bool(self.needs_scrolling)]
+        controls_label = self._render_text(controls_text, self.small_font, self.COLOR_TEXT)
+        blit_sequence.append((controls_label, (10, hud_y + 80)))
         
         # Arrow toggle status
-        arrow_status_parts = []
-        if self.show_trade_arrows:
-            arrow_status_parts.append("Trade")
-        if self.show_forage_arrows:
-            arrow_status_parts.append("Forage")
-        
-        if arrow_status_parts:
-            arrow_status = "Arrows: " + "+".join(arrow_status_parts)
-        else:
-            arrow_status = "Arrows: OFF"
-        
-        arrow_label = self.small_font.render(arrow_status, True, self.COLOR_TEXT)
-        self.screen.blit(arrow_label, (10, hud_y + 95))
+        arrow_status = HUD_ARROW_STATUS_TEXT[bool(self.show_trade_arrows), bool(self.show_forage_arrows)]
+        arrow_label = self._render_text(arrow_status, self.small_font, self.COLOR_TEXT)
+        blit_sequence.append((arrow_label, (10, hud_y + 95)))
         
         # Recent trades (right-justified, accounting for total window width)
         trade_hud_y = hud_y
-        trade_title = self.font.render("Recent Trades:", True, self.COLOR_TEXT)
+        trade_title = self._render_text("Recent Trades:", self.font, self.COLOR_TEXT)
         trade_title_width = trade_title.get_width()
         trade_x_start = self.total_window_width - trade_title_width - 10  # 10px margin from right edge
-        self.screen.blit(trade_title, (trade_x_start, trade_hud_y))
+        blit_sequence.append((trade_title, (trade_x_start, trade_hud_y)))
+        
+        # Trade lines shown last time, reused while the trade stays in the list
+        trade_texts = {}
         
         for i, trade in enumerate(reversed(self.recent_trades)):
             if i >= 5: break
@@ -1005,17 +1674,25 @@ class VMTRenderer:
             dB = trade['dB']
             price = trade['price']
             
-            # Format barter trade (A<->B only)
-            # Convert dA and dB to Decimal if needed, then format
-            dA_formatted = self.format_decimal(Decimal(str(dA)) if not isinstance(dA, Decimal) else dA)
-            dB_formatted = self.format_decimal(Decimal(str(dB)) if not isinstance(dB, Decimal) else dB)
-            price_formatted = self.format_decimal(Decimal(str(price)) if not isinstance(price, Decimal) else price)
-            trade_text = f"T{tick}: {buyer} buys {dA_formatted}A from {seller} for {dB_formatted}B @ {price_formatted}"
+            key = (tick, buyer, seller, dA, dB, price)
+            trade_text = self._trade_texts.get(key)
+            if trade_text is None:
+                # Format barter trade (A<->B only)
+                # Convert dA and dB to Decimal if needed, then format
+                dA_formatted = self.format_decimal(Decimal(str(dA)) if not isinstance(dA, Decimal) else dA)
+                dB_formatted = self.format_decimal(Decimal(str(dB)) if not isinstance(dB, Decimal) else dB)
+                price_formatted = self.format_decimal(Decimal(str(price)) if not isinstance(price, Decimal) else price)
+                trade_text = f"T{tick}: {buyer} buys {dA_formatted}A from {seller} for {dB_formatted}B @ {price_formatted}"
+            trade_texts[key] = trade_text
             
-            trade_label = self.small_font.render(trade_text, True, self.COLOR_TEXT)
+            trade_label = self._render_text(trade_text, self.small_font, self.COLOR_TEXT)
             trade_label_width = trade_label.get_width()
             trade_x = self.total_window_width - trade_label_width - 10  # Right-justify each trade line
-            self.screen.blit(trade_label, (trade_x, trade_hud_y + 20 + i * 15))
+            blit_sequence.append((trade_label, (trade_x, trade_hud_y + 20 + i * 15)))
+        
+        self._trade_texts = trade_texts
+        
+        self._blit_batch(blit_sequence)
     
     def add_trade_indicator(self, pos: tuple[int, int]):
         """Add a trade indicator at the given position."""
@@ -1023,6 +1700,13 @@ class VMTRenderer:
     
     def update_trade_history(self):
         """Update trade history from recent trades for exchange rate calculations."""
+        # A reset simulation starts again from tick 0, so start a new history
+        if id(self.sim) != self._trade_history_sim_id:
+            self.trade_history = deque(maxlen=TRADE_HISTORY_LENGTH)
+            self._trade_history_index = {}
+            self._rate_history = {}
+            self._trade_history_sim_id = id(self.sim)
+        
         # Process recent trades from telemetry
         for trade in self.sim.telemetry.recent_trades_for_renderer:
             tick = trade['tick']
@@ -1041,17 +1725,36 @@ class VMTRenderer:
             
             # Add to history if valid
             if rate is not None and rate_type is not None:
-                # Check if this trade is already in history
-                already_exists = any(
-                    h[0] == tick and h[1] == rate_type and abs(h[2] - rate) < 0.0001
-                    for h in self.trade_history
-                )
-                if not already_exists:
-                    self.trade_history.append((tick, rate_type, rate))
-        
-        # Keep only last 1000 trades to prevent memory issues
-        if len(self.trade_history) > 1000:
-            self.trade_history = self.trade_history[-1000:]
+                # Check if this trade is already in history (only trades at
+                # the same tick and of the same type can match)
+                key = (tick, rate_type)
+                same_tick_rates = self._trade_history_index.get(key, ())
+                if any(abs(r - rate) < 0.0001 for r in same_tick_rates):
+                    continue
+                
+                # Keep only the most recent trades to prevent memory issues
+                if len(self.trade_history) == self.trade_history.maxlen:
+                    self._forget_oldest_trade()
+                
+                self.trade_history.append((tick, rate_type, rate))
+                self._trade_history_index.setdefault(key, []).append(rate)
+                ticks, rates = self._rate_history.setdefault(rate_type, ([], []))
+                ticks.append(tick)
+                rates.append(rate)
+    
+    def _forget_oldest_trade(self):
+        """Drop the oldest trade from trade_history and its derived indexes."""
+        tick, rate_type, _ = self.trade_history.popleft()
+        
+        key = (tick, rate_type)
+        same_tick_rates = self._trade_history_index[key]
+        del same_tick_rates[0]
+        if not same_tick_rates:
+            del self._trade_history_index[key]
+        
+        ticks, rates = self._rate_history[rate_type]
+        del ticks[0]
+        del rates[0]
     
     def calculate_exchange_rate_averages(self, rate_type: str) -> dict[str, float | None]:
         """
@@ -1066,10 +1769,10 @@ class VMTRenderer:
         """
         current_tick = self.sim.tick
         
-        # Filter trades by rate type
-        relevant_trades = [(tick, rate) for tick, rtype, rate in self.trade_history if rtype == rate_type]
+        # Trades of this rate type, split out by update_trade_history
+        ticks, rates = self._rate_history.get(rate_type, ([], []))
         
-        if not relevant_trades:
+        if not ticks:
             return {
                 'last_tick': None,
                 'last_10': None,
@@ -1077,29 +1780,62 @@ class VMTRenderer:
                 'lifetime': None
             }
         
-        # Calculate averages for different windows
+        # Calculate averages for different windows. Ticks are sorted, so each
+        # window is a slice found by bisection instead of a scan.
         result = {}
         
         # Last tick only
-        last_tick_trades = [rate for tick, rate in relevant_trades if tick == current_tick]
+        last_tick_trades = rates[
+            bisect.bisect_left(ticks, current_tick):bisect.bisect_right(ticks, current_tick)
+        ]
         result['last_tick'] = sum(last_tick_trades) / len(last_tick_trades) if last_tick_trades else None
         
         # Last 10 ticks
-        last_10_trades = [rate for tick, rate in relevant_trades if current_tick - tick < 10]
+        last_10_trades = rates[bisect.bisect_right(ticks, current_tick - 10):]
         result['last_10'] = sum(last_10_trades) / len(last_10_trades) if last_10_trades else None
         
         # Last 50 ticks
-        last_50_trades = [rate for tick, rate in relevant_trades if current_tick - tick < 50]
+        last_50_trades = rates[bisect.bisect_right(ticks, current_tick - 50):]
         result['last_50'] = sum(last_50_trades) / len(last_50_trades) if last_50_trades else None
         
         # Lifetime
-        all_rates = [rate for _, rate in relevant_trades]
-        result['lifetime'] = sum(all_rates) / len(all_rates) if all_rates else None
+        result['lifetime'] = sum(rates) / len(rates)
         
         return result
     
+    def _draw_cached_panel(self, name: str, key: tuple, rect: pygame.Rect, render_panel):
+        """
+        Draw a panel by blitting its last rendering, unless `key` changed.
+        
+        On a miss the panel is rendered onto the screen as usual and the
+        screen area `rect` is copied into the cache for later frames.
+        """
+        cached = self._panel_cache.get(name)
+        if cached is not None and cached[0] == key:
+            self.screen.blit(cached[1], rect.topleft)
+            return
+        
+        render_panel()
+        
+        # Reuse the previous surface unless the panel changed size
+        if cached is not None and cached[1].get_size() == rect.size:
+            surface = cached[1]
+        else:
+            surface = pygame.Surface(rect.size).convert()
+        surface.blit(self.screen, (0, 0), rect)
+        self._panel_cache[name] = (key, surface)
+    
     def draw_left_panel(self):
         """Draw the left info panel with exchange rate information."""
+        # Panel contents only change between ticks, so reuse the last rendering.
+        # It is drawn right after the background fill, so the copied area
+        # holds nothing but the panel.
+        key = (id(self.sim), self.sim.tick)
+        rect = pygame.Rect(0, 0, self.left_panel_width + 2, self.screen.get_height())
+        self._draw_cached_panel('left', key, rect, self._render_left_panel)
+    
+    def _render_left_panel(self):
+        """Render the left panel directly onto the screen."""
         # Draw background
         pygame.draw.rect(
             self.screen, self.COLOR_PANEL_BACKGROUND,
@@ -1118,7 +1854,7 @@ class VMTRenderer:
         
         # Draw title
         y_offset = 10
-        title = self.font.render("Exchange Rates", True, self.COLOR_TEXT)
+        title = self._render_text("Exchange Rates", self.font, self.COLOR_TEXT)
         self.screen.blit(title, (10, y_offset))
         y_offset += 30
         
@@ -1129,7 +1865,7 @@ class VMTRenderer:
         
         for rate_type, label in rate_types:
             # Draw section header
-            header = self.font.render(label + ":", True, self.COLOR_TEXT)
+            header = self._render_text(label + ":", self.font, self.COLOR_TEXT)
             self.screen.blit(header, (10, y_offset))
             y_offset += 20
             
@@ -1152,7 +1888,7 @@ class VMTRenderer:
                 else:
                     text = f"  {window_label}: --"
                 
-                label_surface = self.small_font.render(text, True, self.COLOR_TEXT)
+                label_surface = self._render_text(text, self.small_font, self.COLOR_TEXT)
                 self.screen.blit(label_surface, (10, y_offset))
                 y_offset += 15
             
@@ -1165,21 +1901,21 @@ class VMTRenderer:
             y_offset += 20
             
             # Draw inventory section header
-            inventory_header = self.font.render("Agent Inventories", True, self.COLOR_TEXT)
+            inventory_header = self._render_text("Agent Inventories", self.font, self.COLOR_TEXT)
             self.screen.blit(inventory_header, (10, y_offset))
             y_offset += 25
             
-            # Display each agent's inventory
-            for agent in sorted(self.sim.agents, key=lambda a: a.id):
+            # Display each agent's inventory (Simulation keeps agents in ID order)
+            for agent in self.sim.agents:
                 # Agent ID and position
                 agent_info = f"Agent {agent.id} (pos: {agent.pos[0]},{agent.pos[1]}):"
-                agent_label = self.small_font.render(agent_info, True, self.COLOR_TEXT)
+                agent_label = self._render_text(agent_info, self.small_font, self.COLOR_TEXT)
                 self.screen.blit(agent_label, (10, y_offset))
                 y_offset += 18
                 
                 # Inventory values
                 inventory_text = f"  A: {self.format_decimal(agent.inventory.A)}, B: {self.format_decimal(agent.inventory.B)}"
-                inventory_label = self.small_font.render(inventory_text, True, self.COLOR_TEXT)
+                inventory_label = self._render_text(inventory_text, self.small_font, self.COLOR_TEXT)
                 self.screen.blit(inventory_label, (15, y_offset))
                 y_offset += 18
                 
@@ -0,0 +1,152 @@
+"""
+Tests for log viewer SQL query builders.
+
+These run the generated SQL against a real TelemetryDatabase so no Qt
+dependency is needed.
+"""
+
+import pytest
+
+from telemetry.database import TelemetryDatabase
+from vmt_log_viewer.queries import QueryBuilder
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Telemetry database with a handful of trades across two ticks."""
+    database = TelemetryDatabase(tmp_path / "telemetry.db")
+    run_id = database.create_run("test", "2025-01-01T00:00:00", 4, 5, 5)
+    trades = [
+        (run_id, 1, 0, 0, 1, 2, 3, 6, 2.0, "i_buys_A", "A<->B"),
+        (run_id, 1, 1, 1, 3, 4, 1, 3, 3.0, "j_buys_A", "A<->B"),
+        (run_id, 2, 2, 2, 1, 3, 2, 2, 1.0, "i_buys_A", "A<->B"),
+    ]
+    database.executemany("""
+        INSERT INTO trades
+        (run_id, tick, x, y, buyer_id, seller_id, dA, dB, price, direction, exchange_pair_type)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, trades)
+    database.commit()
+    yield database, run_id
+    database.close()
+
+
+def test_trade_summary_at_tick(db):
+    """Summary aggregates only the trades at the requested tick."""
+    database, run_id = db
+    query, params = QueryBuilder.get_trade_summary_at_tick(run_id, 1)
+    row = database.execute(query, params).fetchone()
+
+    assert row['trade_count'] == 2
+    assert row['total_dA'] == 4 and isinstance(row['total_dA'], int)
+    assert row['total_dB'] == 9 and isinstance(row['total_dB'], int)
+    assert row['avg_price'] == pytest.approx(2.5)
+
+
+def test_trade_summary_at_empty_tick(db):
+    """Summary at a tick with no trades reports a zero count."""
+    database, run_id = db
+    query, params = QueryBuilder.get_trade_summary_at_tick(run_id, 99)
+    row = database.execute(query, params).fetchone()
+
+    assert row['trade_count'] == 0
+    assert row['total_dA'] == 0 and row['total_dB'] == 0
+    assert row['avg_price'] is None
+
+
+def test_trades_at_tick_paging(db):
+    """Pages of trades at a tick are disjoint and cover every trade."""
+    database, run_id = db
+    query, params = QueryBuilder.get_trades_at_tick(run_id, 1, limit=1)
+    first = database.execute(query, params).fetchall()
+    query, params = QueryBuilder.get_trades_at_tick(run_id, 1, limit=1, offset=1)
+    second = database.execute(query, params).fetchall()
+    query, params = QueryBuilder.get_trades_at_tick(run_id, 1)
+    everything = database.execute(query, params).fetchall()
+
+    assert len(first) == 1 and len(second) == 1
+    assert [r['id'] for r in first + second] == [r['id'] for r in everything]
+
+
+def test_trades_at_tick_leading_columns(db):
+    """Trade rows lead with the trade view's display columns, in order."""
+    database, run_id = db
+    query, params = QueryBuilder.get_trades_at_tick(run_id, 1)
+    cursor = database.execute(query, params)
+    names = [d[0] for d in cursor.description]
+
+    assert names[:9] == [
+        'buyer_id', 'seller_id', 'x', 'y', 'dA', 'dB',
+        'price', 'direction', 'exchange_pair_type',
+    ]
+
+
+def _query_plan(database, query, params):
+    """Return the EXPLAIN QUERY PLAN detail text for a query."""
+    rows = database.execute("EXPLAIN QUERY PLAN " + query, params).fetchall()
+    return " ".join(row['detail'] for row in rows)
+
+
+def test_trades_at_tick_uses_run_tick_index(db):
+    """Per-tick trade lookups are served by the (run_id, tick) index."""
+    database, run_id = db
+    query, params = QueryBuilder.get_trades_at_tick(run_id, 1, limit=10)
+    plan = _query_plan(database, query, params)
+
+    assert "idx_trades_run_tick" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_trade_attempts_uses_pair_index(db):
+    """Trade attempt lookups are served by the buyer/seller/tick index."""
+    database, run_id = db
+    query, params = QueryBuilder.get_trade_attempts_for_trade(run_id, 1, 2, 1)
+    plan = _query_plan(database, query, params)
+
+    assert "idx_trade_attempts_pair" in plan
+
+
+def test_trades_at_tick_single_statement_shape():
+    """Paged and unpaged trade queries share one SQL text."""
+    unpaged, _ = QueryBuilder.get_trades_at_tick(1, 5)
+    paged, params = QueryBuilder.get_trades_at_tick(1, 5, limit=500, offset=1000)
+
+    assert unpaged == paged
+    assert params == (1, 5, 500, 1000)
+
+
+def test_trades_at_tick_ordered_nulls_last(db):
+    """Ordered trades put NULLs last in both directions and page in that order."""
+    database, run_id = db
+    database.execute("""
+        INSERT INTO trades
+        (run_id, tick, x, y, buyer_id, seller_id, dA, dB, price, direction, exchange_pair_type)
+        VALUES (?, 1, 2, 2, 4, 1, 1, 1, 5.0, 'i_buys_A', NULL)
+    """, (run_id,))
+    database.commit()
+
+    cases = (
+        ('price', False, [2.0, 3.0, 5.0]),
+        ('price', True, [5.0, 3.0, 2.0]),
+        ('exchange_pair_type', False, [2.0, 3.0, 5.0]),
+        ('exchange_pair_type', True, [2.0, 3.0, 5.0]),
+    )
+    for column, descending, expected in cases:
+        query, params = QueryBuilder.get_trades_at_tick(
+            run_id, 1, order_by=column, descending=descending
+        )
+        assert [r['price'] for r in database.execute(query, params)] == expected
+
+        pages = []
+        for offset in range(3):
+            query, params = QueryBuilder.get_trades_at_tick(
+                run_id, 1, limit=1, offset=offset, order_by=column, descending=descending
+            )
+            pages += [r['price'] for r in database.execute(query, params)]
+        assert pages == expected
+
+
+def test_trades_at_tick_rejects_unknown_order_column():
+    """Only the display columns can be used to order trades."""
+    with pytest.raises(ValueError):
+        QueryBuilder.get_trades_at_tick(1, 1, order_by='price; DROP TABLE trades')
@@ -203,5 +203,22 @@ def test_deterministic_positions():
         assert pos3 == renderer.calculate_agent_display_position(2, 3, 15, 15)
 
 
+def test_precomputed_offsets_match_layout():
+    """Renderer's precomputed offset tables reproduce the co-location layouts."""
+    from vmt_pygame.renderer import VMTRenderer, MAX_LAYOUT_GROUP
+    
+    for cell_size in [5, 8, 13, 20, 30, 47, 60]:
+        mock = MockRenderer(cell_size=cell_size)
+        renderer = VMTRenderer.__new__(VMTRenderer)  # No display needed
+        renderer.cell_size = cell_size
+        renderer._build_layout_offsets()
+        
+        # Includes group sizes past the table, which are computed on demand
+        for agent_count in range(1, MAX_LAYOUT_GROUP + 4):
+            for i in range(agent_count):
+                assert renderer.calculate_agent_display_position(i, agent_count, 100, 50) == \
+                    mock.calculate_agent_display_position(i, agent_count, 100, 50)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])